@@ -1,3 +1,8 @@
+import os
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from puzzle_input import Source, get_buffer, strip_bounds
+
 # noinspection SpellCheckingInspection
 EXAMPLE1 = """
 1abc2
@@ -18,68 +23,197 @@ zoneight234
 """
 
 
-def get_calibration_number(input_text):
+DIGITS = {str(d): d for d in range(10)}
+SPELLED_DIGITS = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9
+}
+
+Trie = Dict[int, Union["Trie", int]]
+
+
+def build_trie(words: Dict[str, int], reverse: bool = False) -> Trie:
+    """
+    Trie over the bytes of the words (or of the reversed words). Since no word is the prefix of another one, the last
+    byte of each word maps directly to its digit value instead of another node.
+    """
+    trie = {}
+    for word, value in words.items():
+        word_bytes = (word[::-1] if reverse else word).encode("ascii")
+        node = trie
+        for byte in word_bytes[:-1]:
+            node = node.setdefault(byte, {})
+        node[word_bytes[-1]] = value
+
+    return trie
+
+
+DIGIT_TRIES = (build_trie(DIGITS), build_trie(DIGITS, reverse=True))
+CORRECTED_DIGIT_TRIES = (
+    build_trie({**DIGITS, **SPELLED_DIGITS}), build_trie({**DIGITS, **SPELLED_DIGITS}, reverse=True)
+)
+
+
+def find_first_digit(data: bytes, start: int, end: int, trie: Trie) -> Optional[int]:
+    """
+    Value of the first word of the trie in data[start:end], without slicing the data. As the words may overlap (e.g.
+    "twone"), a match is tried at every position, and the scan stops at the first one.
+    """
+    for i in range(start, end):
+        node = trie.get(data[i])
+        j = i + 1
+        while node is not None:
+            if node.__class__ is int:
+                return node
+            if j == end:
+                break
+            node = node.get(data[j])
+            j += 1
+
+    return None
+
+
+def find_last_digit(data: bytes, start: int, end: int, reverse_trie: Trie) -> Optional[int]:
+    """
+    Same as find_first_digit, but scanning backwards from the end using the trie of the reversed words.
+    """
+    for i in range(end - 1, start - 1, -1):
+        node = reverse_trie.get(data[i])
+        j = i - 1
+        while node is not None:
+            if node.__class__ is int:
+                return node
+            if j < start:
+                break
+            node = node.get(data[j])
+            j -= 1
+
+    return None
+
+
+def iter_line_bounds(data: bytes, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    while start < end:
+        line_end = data.find(b"\n", start, end)
+        if line_end == -1:
+            line_end = end
+        yield start, line_end
+        start = line_end + 1
+
+
+def sum_calibration_values(data: bytes, start: int, end: int, tries: Tuple[Trie, Trie]) -> int:
+    trie, reverse_trie = tries
     res = 0
-    for line in input_text.strip().split("\n"):
-        first_char = next_char = None
-        for char in line:
-            if str.isdigit(char):
-                if first_char is None:
-                    first_char = int(char)
-                next_char = int(char)
-        assert first_char is not None and next_char is not None, (
-            "No number found in input line " + line
+    for line_start, line_end in iter_line_bounds(data, start, end):
+        first_digit = find_first_digit(data, line_start, line_end, trie)
+        assert first_digit is not None, (
+                "No number found in input line " + data[line_start:line_end].decode("ascii")
         )
-        res += int(f"{first_char}{next_char}")
+        res += 10 * first_digit + find_last_digit(data, line_start, line_end, reverse_trie)
 
     return res
 
 
-def get_corrected_calibration_number(input_text):
-    num_dict = {
-        "one": 1,
-        "two": 2,
-        "three": 3,
-        "four": 4,
-        "five": 5,
-        "six": 6,
-        "seven": 7,
-        "eight": 8,
-        "nine": 9
-    }
+def _get_bytes(input_text: Source) -> bytes:
+    data = get_buffer(input_text)
+    return data.encode("ascii") if isinstance(data, str) else data
+
 
+def get_calibration_number(input_text: Source) -> int:
+    data = _get_bytes(input_text)
+    return sum_calibration_values(data, *strip_bounds(data), DIGIT_TRIES)
+
+
+def get_corrected_calibration_number(input_text: Source) -> int:
+    data = _get_bytes(input_text)
+    return sum_calibration_values(data, *strip_bounds(data), CORRECTED_DIGIT_TRIES)
+
+
+CHUNK_SIZE = 1 << 24
+
+
+def get_chunk_bounds(path: str, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Split the file into byte ranges of roughly chunk_size bytes, each of which ends right after a line break.
+    """
+    bounds = []
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                fh.seek(end - 1)
+                end += len(fh.readline()) - 1
+            bounds.append((start, end))
+            start = end
+
+    return bounds
+
+
+def sum_calibration_values_of_chunk(path: str, start: int, end: int) -> Tuple[Optional[int], int]:
+    """
+    Calibration values of part 1 and part 2 summed up over the lines in the given byte range of the file, in a single
+    pass over the lines. The sum of part 1 is None if any line contains spelled-out digits only.
+    """
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        data = fh.read(end - start)
+
+    trie, reverse_trie = DIGIT_TRIES
+    corrected_trie, corrected_reverse_trie = CORRECTED_DIGIT_TRIES
     res = 0
-    for line in input_text.strip().split("\n"):
-        first_char = next_char = None
-        for i, char in enumerate(line):
-            found_num = None
-            if str.isdigit(char):
-                found_num = int(char)
-            else:
-                for n in range(3, 6):
-                    lookahead = line[i:i + n]
-                    found_num = num_dict.get(lookahead, None)
-                    if found_num is not None:
-                        break
-            if found_num is not None:
-                if first_char is None:
-                    first_char = found_num
-                next_char = found_num
-
-        assert first_char is not None and next_char is not None, (
-                "No number found in input line " + line
+    corrected_res = 0
+    for line_start, line_end in iter_line_bounds(data, *strip_bounds(data)):
+        first_digit = find_first_digit(data, line_start, line_end, corrected_trie)
+        assert first_digit is not None, (
+                "No number found in input line " + data[line_start:line_end].decode("ascii")
         )
-        res += int(f"{first_char}{next_char}")
+        corrected_res += 10 * first_digit + find_last_digit(data, line_start, line_end, corrected_reverse_trie)
+        if res is not None:
+            first_digit = find_first_digit(data, line_start, line_end, trie)
+            if first_digit is None:
+                res = None
+            else:
+                res += 10 * first_digit + find_last_digit(data, line_start, line_end, reverse_trie)
 
-    return res
+    return res, corrected_res
+
+
+def get_calibration_numbers_of_file(
+        path: str, num_workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE
+) -> Tuple[Optional[int], int]:
+    """
+    Both calibration numbers of an arbitrarily large input file. The chunks of the file are processed by a pool of
+    worker processes, each of which only reads its own chunk, so the memory usage doesn't depend on the file size.
+    """
+    bounds = get_chunk_bounds(path, chunk_size)
+    if len(bounds) <= 1 or num_workers == 1:
+        partial_sums = [sum_calibration_values_of_chunk(path, start, end) for start, end in bounds]
+    else:
+        # concurrent.futures pulls in logging and multiprocessing, which only files split into several chunks need
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            partial_sums = list(executor.map(sum_calibration_values_of_chunk, *zip(*[(path, *b) for b in bounds])))
+
+    sums = [res for res, _ in partial_sums]
+    res = None if None in sums else sum(sums)
+
+    return res, sum(corrected_res for _, corrected_res in partial_sums)
 
 
 if __name__ == '__main__':
-    with open("../inputs/input1.txt", "r") as fh:
-        in_text = fh.read()
+    calibration_number, corrected_calibration_number = get_calibration_numbers_of_file("../inputs/input1.txt")
 
     # PART 1
-    print(get_calibration_number(in_text))
+    print(calibration_number)
 
     # PART 2
-    print(get_corrected_calibration_number(in_text))
+    print(corrected_calibration_number)
@@ -2,6 +2,9 @@ import copy
 
 import numpy as np
 
+from grid import load_grid
+from puzzle_input import InputFile
+
 EXAMPLE1 = """
 -L|F7
 7S-7|
@@ -32,15 +35,11 @@ EXAMPLE3 = """
 
 
 def parse_input(text):
-    field = []
-    for line in text.strip().split("\n"):
-        field.append(list(line.strip()))
-
-    return np.array(field)
+    return load_grid(text)
 
 
 def get_starting_coordinates(field):
-    coords = np.where(field == "S")
+    coords = np.where(field == ord("S"))
     assert len(coords[0]) == 1, "Multiple starting points detected!"
 
     return coords[0][0], coords[1][0]
@@ -48,10 +47,10 @@ def get_starting_coordinates(field):
 
 def get_loop(field):
     orientations = {
-        "u": {"|": "u", "F": "r", "7": "l"},
-        "d": {"|": "d", "L": "r", "J": "l"},
-        "l": {"-": "l", "F": "d", "L": "u"},
-        "r": {"-": "r", "7": "d", "J": "u"},
+        "u": {ord("|"): "u", ord("F"): "r", ord("7"): "l"},
+        "d": {ord("|"): "d", ord("L"): "r", ord("J"): "l"},
+        "l": {ord("-"): "l", ord("F"): "d", ord("L"): "u"},
+        "r": {ord("-"): "r", ord("7"): "d", ord("J"): "u"},
     }
 
     displacements = {
@@ -61,12 +60,12 @@ def get_loop(field):
         "r": (lambda c: (c[0], c[1] + 1)),
     }
 
-    coords = get_starting_coordinates(my_field)
+    coords = get_starting_coordinates(field)
     loop_coords = []
 
     # Starting point has no initial direction. Find one of the two valid directions
     for direction, index_operation in displacements.items():
-        if field[displacements[direction](coords)] in orientations[direction].keys():
+        if field.item(displacements[direction](coords)) in orientations[direction].keys():
             break
     else:
         raise ValueError("Starting point is isolated!")
@@ -90,9 +89,9 @@ def get_loop(field):
             loop_coords.append((double_res_grid_x, double_res_grid_y - 1))
 
         try:
-            direction = orientations[direction][field[coords]]
+            direction = orientations[direction][field.item(coords)]
         except KeyError as e:
-            if e.args[0] == "S":  # Starting point reached again
+            if e.args[0] == ord("S"):  # Starting point reached again
                 break
             else:
                 raise e
@@ -133,8 +132,7 @@ def get_num_enclosed_tiles_using_floodfill(loop_tiles_double_res):
 
 
 if __name__ == "__main__":
-    with open("../inputs/input10.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input10.txt")
 
     # PART 1
     my_field = parse_input(in_text)
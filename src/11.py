@@ -1,5 +1,11 @@
 import numpy as np
 
+from grid import load_grid
+from puzzle_input import InputFile
+
+EMPTY_SPACE = np.uint8(ord("."))
+GALAXY = np.uint8(ord("#"))
+
 EXAMPLE1 = """
 ...#......
 .......#..
@@ -15,11 +21,7 @@ EXAMPLE1 = """
 
 
 def parse_input(text):
-    input_as_list_of_lists = []
-    for line in text.strip().split("\n"):
-        input_as_list_of_lists.append(list(line.strip()))
-
-    return np.array(input_as_list_of_lists)
+    return load_grid(text)
 
 
 def get_empty_space(matrix):
@@ -28,13 +30,13 @@ def get_empty_space(matrix):
     empty_row_idcs = []
     for i in range(i_max):
         row_elements = np.unique(matrix[i, :])
-        if len(row_elements) == 1 and row_elements[0] == ".":
+        if len(row_elements) == 1 and row_elements[0] == EMPTY_SPACE:
             empty_row_idcs.append(i)
 
     empty_col_idcs = []
     for j in range(j_max):
         col_elements = np.unique(matrix[:, j])
-        if len(col_elements) == 1 and col_elements[0] == ".":
+        if len(col_elements) == 1 and col_elements[0] == EMPTY_SPACE:
             empty_col_idcs.append(j)
 
     return empty_row_idcs, empty_col_idcs
@@ -44,7 +46,7 @@ def index_galaxies(matrix, empty_row_idcs, empty_col_idcs, blow_up_factor):
     galaxy_idcs = {}
     counter = 0
     for (i, j), val in np.ndenumerate(matrix):
-        if val == "#":
+        if val == GALAXY:
             blown_up_i = i
             for r in empty_row_idcs:
                 if r < i:
@@ -78,8 +80,7 @@ def get_sum_of_path_lengths(galaxy_idcs):
 
 
 if __name__ == "__main__":
-    with open("../inputs/input11.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input11.txt")
 
     # PART 1
     observation_array = parse_input(in_text)
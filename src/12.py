@@ -1,6 +1,9 @@
 import time
 from functools import cache
 
+from instrumentation import profiled
+from puzzle_input import InputFile, iter_lines
+
 EXAMPLE1 = """
 ???.### 1,1,3
 .??..??...?##. 1,1,3
@@ -13,7 +16,7 @@ EXAMPLE1 = """
 
 def parse_input(text, num_copies=1):
     rows = []
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         springs, groups_text = map(lambda s: s.strip(), line.strip().split(" "))
         groups = list(map(int, groups_text.strip().split(",")))
         springs += "?"
@@ -58,6 +61,7 @@ def get_all_groups_of_operational_springs(springs):
     return tuple(operational_springs)
 
 
+@profiled
 @cache
 def get_num_combinations(springs, operational_spring_groups):
     first_group, end_idx = get_first_group_of_operational_springs(springs)
@@ -102,8 +106,7 @@ def get_num_combinations_all_rows(damaged_spring_records):
 
 
 if __name__ == "__main__":
-    with open("../inputs/input12.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input12.txt")
 
     # PART 1
     start = time.perf_counter()
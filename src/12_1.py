@@ -1,5 +1,7 @@
 import time
 
+from puzzle_input import InputFile, iter_lines
+
 EXAMPLE1 = """
 ???.### 1,1,3
 .??..??...?##. 1,1,3
@@ -12,7 +14,7 @@ EXAMPLE1 = """
 
 def parse_input(text, num_copies=1):
     rows = []
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         springs, groups_text = map(lambda s: s.strip(), line.strip().split(" "))
         groups = list(map(int, groups_text.strip().split(",")))
         springs += "?"
@@ -102,8 +104,7 @@ def get_num_combinations_all_rows(damaged_spring_records):
 
 
 if __name__ == "__main__":
-    with open("../inputs/input12.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input12.txt")
 
     # PART 1
     start = time.perf_counter()
@@ -3,6 +3,9 @@ from typing import List
 
 import numpy as np
 
+from grid import load_grid
+from puzzle_input import InputFile, Source, iter_blocks
+
 EXAMPLE1 = """
 #.##..##.
 ..#.##.#.
@@ -22,20 +25,10 @@ EXAMPLE1 = """
 """
 
 
-def parse_input(text: str) -> List[np.ndarray]:
+def parse_input(text: Source) -> List[np.ndarray]:
     patterns = []
-    for pattern_text in text.strip().split("\n\n"):
-        pattern_lines = pattern_text.strip().split("\n")
-        mat = np.empty((len(pattern_lines), len(pattern_lines[0])), dtype='bool')
-        for i, line in enumerate(pattern_lines):
-            for j, char in enumerate(line):
-                if char == ".":
-                    mat[i, j] = False
-                elif char == "#":
-                    mat[i, j] = True
-                else:
-                    raise ValueError("Found unexpected character!")
-        patterns.append(mat)
+    for pattern_lines in iter_blocks(text):
+        patterns.append(load_grid("\n".join(pattern_lines), {".": False, "#": True}, dtype=bool))
     return patterns
 
 
@@ -108,8 +101,7 @@ def find_new_reflection_index(pattern: np.ndarray) -> int:
 
 
 if __name__ == "__main__":
-    with open("../inputs/input13.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input13.txt")
 
     ash_and_rocks_patterns = parse_input(in_text)
 
@@ -4,6 +4,9 @@ from typing import Tuple, List
 
 import numpy as np
 
+from grid import load_grid
+from puzzle_input import InputFile, Source
+
 EXAMPLE1 = """
 O....#....
 O.OO#....#
@@ -18,21 +21,8 @@ O.#..O.#.#
 """
 
 
-def parse_input(text: str) -> np.ndarray:
-    lines = text.strip().split("\n")
-    platform_grid = np.empty((len(lines[0]), len(lines)), dtype=np.uint8)
-    for i, line in enumerate(lines):
-        for j, char in enumerate(line.strip()):
-            if char == "#":
-                platform_grid[i, j] = 2
-            elif char == "O":
-                platform_grid[i, j] = 1
-            elif char == ".":
-                platform_grid[i, j] = 0
-            else:
-                raise ValueError("Invalid character.")
-
-    return platform_grid
+def parse_input(text: Source) -> np.ndarray:
+    return load_grid(text, {"#": 2, "O": 1, ".": 0})
 
 
 def tilt(col: np.ndarray, left: bool = True) -> np.ndarray:
@@ -104,8 +94,7 @@ def calculate_north_load_after_cycles(platform: np.ndarray, num_cycles: int = 10
 
 
 if __name__ == "__main__":
-    with open("../inputs/input14.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input14.txt")
 
     # PART 1
     start = time.perf_counter()
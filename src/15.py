@@ -1,12 +1,14 @@
 import time
-from typing import List, Dict
+from typing import Dict, Iterator, List
+
+from puzzle_input import InputFile, Source, iter_records
 
 EXAMPLE1 = "HASH"
 EXAMPLE2 = """rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"""
 
 
-def parse_input(text: str) -> List[str]:
-    return text.strip().split(",")
+def parse_input(text: Source) -> Iterator[str]:
+    return iter_records(text, ",")
 
 
 def get_lens_information(lens_text: str) -> List[str]:
@@ -19,7 +21,7 @@ def get_lens_information(lens_text: str) -> List[str]:
         raise ValueError("Wrong format for lens information found!")
 
 
-def parse_input_part_2(text: str) -> List[List[str]]:
+def parse_input_part_2(text: Source) -> List[List[str]]:
     return list(map(get_lens_information, parse_input(text)))
 
 
@@ -55,8 +57,7 @@ def sum_focusing_powers(boxes: List[Dict[str, str]]) -> int:
 
 
 if __name__ == "__main__":
-    with open("../inputs/input15.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input15.txt")
 
     # PART 1
     start = time.perf_counter()
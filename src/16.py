@@ -3,6 +3,10 @@ from typing import Tuple, Dict, List
 
 import numpy as np
 
+from grid import load_grid
+from instrumentation import profiled
+from puzzle_input import InputFile, Source
+
 EXAMPLE1 = r"""
 .|...\....
 |.-.\.....
@@ -16,10 +20,10 @@ EXAMPLE1 = r"""
 ..//.|...."""
 
 ORIENTATIONS = {
-    "u": {"|": "u", "\\": "l", "/": "r", ".": "u"},
-    "d": {"|": "d", "\\": "r", "/": "l", ".": "d"},
-    "l": {"-": "l", "\\": "u", "/": "d", ".": "l"},
-    "r": {"-": "r", "\\": "d", "/": "u", ".": "r"},
+    "u": {ord("|"): "u", ord("\\"): "l", ord("/"): "r", ord("."): "u"},
+    "d": {ord("|"): "d", ord("\\"): "r", ord("/"): "l", ord("."): "d"},
+    "l": {ord("-"): "l", ord("\\"): "u", ord("/"): "d", ord("."): "l"},
+    "r": {ord("-"): "r", ord("\\"): "d", ord("/"): "u", ord("."): "r"},
 }
 
 DISPLACEMENTS = {
@@ -37,14 +41,11 @@ SPLITS = {
 }
 
 
-def parse_input(text: str) -> np.ndarray:
-    grid = []
-    for line in text.strip().split("\n"):
-        grid.append(list(line.strip()))
-
-    return np.array(grid)
+def parse_input(text: Source) -> np.ndarray:
+    return load_grid(text)
 
 
+@profiled
 def follow_path(grid: np.ndarray, coords: Tuple[int, int],
                 direction: str, already_visited_grid_points: Dict[Tuple[int, int], List[str]]):
     i_max, j_max = grid.shape
@@ -59,7 +60,7 @@ def follow_path(grid: np.ndarray, coords: Tuple[int, int],
             already_visited_grid_points[coords] = [direction]
 
         try:
-            direction = ORIENTATIONS[direction][grid[coords]]
+            direction = ORIENTATIONS[direction][grid.item(coords)]
         except KeyError:
             # Splitting point reached
             dir1, dir2 = SPLITS[direction]
@@ -122,8 +123,7 @@ def get_max_num_visited_points(grid):
 
 
 if __name__ == "__main__":
-    with open("../inputs/input16.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input16.txt")
 
     # PART 1
     start = time.perf_counter()
@@ -4,6 +4,8 @@ from typing import Tuple, Callable
 
 import numpy as np
 
+from puzzle_input import InputFile, Source, iter_lines
+
 EXAMPLE1 = """
 2413432311323
 3215453535623
@@ -45,9 +47,9 @@ DISPLACEMENTS = [
 ]
 
 
-def parse_input(text: str) -> np.ndarray:
+def parse_input(text: Source) -> np.ndarray:
     grid = []
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         grid.append(list(map(int, line.strip())))
 
     return np.array(grid)
@@ -119,8 +121,7 @@ def find_shortest_distance_dijkstra(
 
 
 if __name__ == "__main__":
-    with open("../inputs/input17.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input17.txt")
 
     block_grid = parse_input(in_text)
 
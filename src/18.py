@@ -1,6 +1,8 @@
 import time
 from typing import List, Tuple
 
+from puzzle_input import InputFile, Source, iter_lines
+
 EXAMPLE1 = """
 R 6 (#70c710)
 D 5 (#0dc571)
@@ -21,9 +23,9 @@ U 2 (#7a21e3)
 DIRECTION_DICT = {"R": 0, "D": 1, "L": 2, "U": 3}
 
 
-def parse_input_part1(text: str) -> List[Tuple[int, int]]:
+def parse_input_part1(text: Source) -> List[Tuple[int, int]]:
     steps = []
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         direction, num_steps, color = line.strip().split(" ")
         num_steps = int(num_steps)
         direction = DIRECTION_DICT[direction]
@@ -32,9 +34,9 @@ def parse_input_part1(text: str) -> List[Tuple[int, int]]:
     return steps
 
 
-def parse_input_part2(text: str) -> List[Tuple[int, int]]:
+def parse_input_part2(text: Source) -> List[Tuple[int, int]]:
     steps = []
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         _, _, hex_code = line.strip().split(" ")
         hex_code = hex_code.replace("(", "").replace(")", "")
         num_steps = int(hex_code[1:-1], 16)
@@ -70,8 +72,7 @@ def get_total_volume(plan: List[Tuple[int, int]]) -> int:
 
 
 if __name__ == "__main__":
-    with open("../inputs/input18.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input18.txt")
 
     # PART 1
     start = time.perf_counter()
@@ -2,6 +2,8 @@ import copy
 import time
 from typing import List, Tuple, Dict, Union
 
+from puzzle_input import InputFile, Source, iter_blocks
+
 EXAMPLE1 = """
 px{a<2006:qkq,m>2090:A,rfg}
 pv{a>1716:R,A}
@@ -30,12 +32,12 @@ PARAM_POSITION_MAPPING = {
 }
 
 
-def parse_input(text: str) -> Tuple[Dict[str, List[Union[str, List[str]]]], List[List[int]]]:
+def parse_input(text: Source) -> Tuple[Dict[str, List[Union[str, List[str]]]], List[List[int]]]:
     workflows = {}
     parts = []
-    workflows_block, parts_block = text.strip().split("\n\n")
+    workflow_lines, part_lines = iter_blocks(text)
 
-    for line in workflows_block.strip().split("\n"):
+    for line in workflow_lines:
         name, steps = line.split("{")
         steps = steps.replace("}", "").split(",")
         step_list = []
@@ -43,7 +45,7 @@ def parse_input(text: str) -> Tuple[Dict[str, List[Union[str, List[str]]]], List
             step_list.append(step.split(":"))
         workflows[name] = step_list
 
-    for line in parts_block.strip().split("\n"):
+    for line in part_lines:
         properties = line.replace("{", "").replace("}", "").split(",")
         properties = list(map(lambda s: int(s[2:]), properties))
         parts.append(properties)
@@ -143,8 +145,7 @@ def run_workflows_and_sum_ratings_of_accepted_parts(
 
 
 if __name__ == "__main__":
-    with open("../inputs/input19.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input19.txt")
 
     # PART 1
     start = time.perf_counter()
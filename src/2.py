@@ -1,4 +1,10 @@
 import re
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from puzzle_input import InputFile, iter_lines
 
 EXAMPLE1 = """
 Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
@@ -9,65 +15,96 @@ Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
 """
 
 
+COLORS = ("red", "green", "blue")
+COLOR_INDICES = {color: i for i, color in enumerate(COLORS)}
+
+GAME_PATTERN = re.compile(r"Game\s(\d+):|(\d+)\s(red|green|blue)")
+
+
+class GameTable(NamedTuple):
+    game_ids: np.ndarray
+    # Maximum number of cubes of each color (columns in the order of COLORS) shown at once per game
+    max_counts: np.ndarray
+
+
 def get_game_statistics(input_str):
-    game_stats = {}
-    game_texts = input_str.strip().split("\n")
-    for game_text in game_texts:
-        game_number_match = re.match(r"Game\s(\d+):", game_text)
-        if game_number_match is not None:
-            game_number = int(game_number_match.groups(1)[0])
-        else:
+    game_ids = []
+    max_counts = []
+    for game_text in iter_lines(input_str):
+        game_number = None
+        counts = [0, 0, 0]
+        for number, count, color in GAME_PATTERN.findall(game_text):
+            if number:
+                game_number = int(number)
+            else:
+                i = COLOR_INDICES[color]
+                count = int(count)
+                if count > counts[i]:
+                    counts[i] = count
+        if game_number is None:
             raise ValueError("No game number provided.")
-        blues = map(int, re.findall(r"(\d+)\sblue", game_text))
-        reds = map(int, re.findall(r"(\d+)\sred", game_text))
-        greens = map(int, re.findall(r"(\d+)\sgreen", game_text))
-        game_stats[game_number] = {"blue": blues, "red": reds, "green": greens}
+        game_ids.append(game_number)
+        max_counts.append(counts)
 
-    return game_stats
+    return GameTable(np.array(game_ids, dtype=np.int64), np.array(max_counts, dtype=np.int64).reshape(-1, 3))
 
 
 def get_possible_games(num_cubes, game_stats):
-    possible_game_numbers = []
-    for game, color_stats in game_stats.items():
-        for color, num_views in color_stats.items():
-            if max(num_views) > num_cubes[color]:
-                break
-        else:
-            possible_game_numbers.append(game)
-
-    return possible_game_numbers
+    bag = np.array([num_cubes[color] for color in COLORS])
+    return game_stats.game_ids[(game_stats.max_counts <= bag).all(axis=1)]
+
+
+def get_possible_game_sums(bags, game_stats, max_block_size=1 << 22):
+    """
+    Sum of the possible game ids for each bag of a (k, 3) array of cube counts (columns in the order of COLORS). Blocks
+    of bags are compared against all games at once by broadcasting, with the blocks small enough to keep the (bags,
+    games) comparison array below max_block_size elements.
+    """
+    bags = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+    # Comparing color by color is much faster than reducing a (bags, games, colors) array over its short last axis
+    max_counts_per_color = np.ascontiguousarray(game_stats.max_counts.T)
+    sums = np.empty(len(bags), dtype=np.int64)
+    block_size = max(1, max_block_size // max(len(game_stats.game_ids), 1))
+    for start in range(0, len(bags), block_size):
+        block = bags[start:start + block_size]
+        possible = max_counts_per_color[0] <= block[:, 0, np.newaxis]
+        for i in range(1, len(COLORS)):
+            possible &= max_counts_per_color[i] <= block[:, i, np.newaxis]
+        sums[start:start + block_size] = possible @ game_stats.game_ids
+
+    return sums
 
 
 def get_min_cubes(game_stats):
-    min_cubes = {}
-    for game, color_stats in game_stats.items():
-        min_cubes[game] = {color: 0 for color in ("blue", "red", "green")}
-        for color, num_views in color_stats.items():
-            min_cubes[game][color] = max(num_views)
-
-    return min_cubes
+    return game_stats.max_counts
 
 
-def get_product_sum(min_cube_dict):
-    res = 0
-    for num_cubes in min_cube_dict.values():
-        power = 1
-        for num in num_cubes.values():
-            power *= num
-        res += power
-
-    return res
+def get_product_sum(min_cubes):
+    return int(min_cubes.prod(axis=1).sum())
 
 
 if __name__ == '__main__':
-    with open("../inputs/input2.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input2.txt")
+    game_statistics = get_game_statistics(in_text)
 
     # PART 1
     num_cubes_in_bag = {"red": 12, "green": 13, "blue": 14}
-    game_statistics = get_game_statistics(in_text)
-    print(sum(get_possible_games(num_cubes_in_bag, game_statistics)))
+    print(int(get_possible_games(num_cubes_in_bag, game_statistics).sum()))
 
     # PART 2
-    min_cubes_per_game = get_min_cubes(get_game_statistics(in_text))
-    print(get_product_sum(min_cubes_per_game))
+    print(get_product_sum(get_min_cubes(game_statistics)))
+
+    # BATCHED BAG QUERIES VS. ONE QUERY PER BAG
+    random_bags = np.random.default_rng(0).integers(1, 21, size=(10000, 3))
+    start = time.perf_counter()
+    res_loop = [
+        int(get_possible_games(dict(zip(COLORS, bag)), game_statistics).sum()) for bag in random_bags.tolist()
+    ]
+    end = time.perf_counter()
+    print(f"Per-bag loop: {end - start} s")
+
+    start = time.perf_counter()
+    res_batched = get_possible_game_sums(random_bags, game_statistics)
+    end = time.perf_counter()
+    print(f"Batched: {end - start} s")
+    assert res_batched.tolist() == res_loop
@@ -5,6 +5,9 @@ import time
 from operator import add
 from typing import List, Dict, Tuple, Union, Any
 
+from instrumentation import profiled
+from puzzle_input import InputFile, Source, iter_lines
+
 EXAMPLE1 = """
 broadcaster -> a, b, c
 %a -> b
@@ -56,6 +59,7 @@ class ModuleRegistry:
                     self._registry[target_id] = target_module
                 self._registry[module_id].register_listeners(target_module)
 
+    @profiled
     def _send_signals(self, from_id: str, check_for_high_pulse_sent_from_module: str) -> Tuple[List[int], bool]:
         sender_queue = [from_id]
         overall_send_stats = [1, 0]
@@ -176,9 +180,9 @@ class DeadEnd(BroadCaster):
         return True
 
 
-def parse_input(text: str) -> ModuleRegistry:
+def parse_input(text: Source) -> ModuleRegistry:
     mod_reg = ModuleRegistry()
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         src_block, tgt_block = line.strip().split(" -> ")
         src_block = src_block.strip()
         tgt_ids = tgt_block.strip().split(", ")
@@ -247,8 +251,7 @@ def get_num_button_pushes_to_send_low_signal_to_rx(mod_reg: ModuleRegistry) -> i
 
 
 if __name__ == "__main__":
-    with open("../inputs/input20.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input20.txt")
 
     # PART 1
     start = time.perf_counter()
@@ -3,6 +3,9 @@ from typing import Tuple, List
 
 import numpy as np
 
+from grid import load_grid, translate_grid
+from puzzle_input import InputFile, Source
+
 EXAMPLE1 = """
 ...........
 .....###.#.
@@ -18,23 +21,12 @@ EXAMPLE1 = """
 """
 
 
-def parse_input(text: str) -> Tuple[np.ndarray, Tuple[int, int]]:
-    lines = text.strip().split("\n")
-    grid = np.empty((len(lines), len(lines[0].strip())), dtype=int)
-    start_pos = (0, 0)
-    for i, line in enumerate(lines):
-        for j, char in enumerate(line.strip()):
-            if char == ".":
-                grid[i, j] = 0
-            elif char == "#":
-                grid[i, j] = 1
-            elif char == "S":
-                grid[i, j] = 0
-                start_pos = (i, j)
-            else:
-                raise ValueError(f"Unexpected input: {char}")
+def parse_input(text: Source) -> Tuple[np.ndarray, Tuple[int, int]]:
+    chars = load_grid(text)
+    start_coords = np.argwhere(chars == ord("S"))
+    start_pos = tuple(start_coords[0].tolist()) if len(start_coords) else (0, 0)
 
-    return np.array(grid), start_pos
+    return translate_grid(chars, {".": 0, "#": 1, "S": 0}, dtype=int), start_pos
 
 
 def get_reachable_garden_plots(grid: np.ndarray, starting_positions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
@@ -175,8 +167,7 @@ def get_num_reachable_garden_plots_after_26501365_steps_on_infinite_grid(
 
 
 if __name__ == "__main__":
-    with open("../inputs/input21.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input21.txt")
 
     # PART 1
     start = time.perf_counter()
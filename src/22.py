@@ -2,7 +2,8 @@ import copy
 import time
 from typing import Tuple, List
 
-from tqdm import tqdm
+from instrumentation import profiled
+from puzzle_input import InputFile, Source, iter_lines
 
 EXAMPLE1 = """
 1,0,1~1,2,1
@@ -15,9 +16,9 @@ EXAMPLE1 = """
 """
 
 
-def parse_input(text: str) -> List[Tuple[List[int], List[int], List[int]]]:
+def parse_input(text: Source) -> List[Tuple[List[int], List[int], List[int]]]:
     blocks = []
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         start_text, end_text = line.strip().split("~")
         (x_start, y_start, z_start) = tuple(map(int, start_text.split(",")))
         (x_end, y_end, z_end) = tuple(map(int, end_text.split(",")))
@@ -26,6 +27,7 @@ def parse_input(text: str) -> List[Tuple[List[int], List[int], List[int]]]:
     return sorted(blocks, key=lambda x: x[2][0])
 
 
+@profiled
 def is_empty_space_below(
     block: Tuple[List[int], List[int], List[int]],
     blocks_below: List[Tuple[List[int], List[int], List[int]]],
@@ -51,6 +53,8 @@ def is_empty_space_below(
 
 
 def stack_blocks(blocks: List[Tuple[List[int], List[int], List[int]]]) -> List[Tuple[List[int], List[int], List[int]]]:
+    from tqdm import tqdm  # Only the progress bar of the stacking needs tqdm, whose import takes tens of milliseconds
+
     stacked_blocks = []
     for block_position in tqdm(blocks):
         new_block_position = copy.deepcopy(block_position)
@@ -92,6 +96,8 @@ def get_num_falling_blocks(blocks: List[Tuple[List[int], List[int], List[int]]],
 
 
 def get_num_disintegratable_blocks(blocks: List[Tuple[List[int], List[int], List[int]]]) -> int:
+    from tqdm import tqdm
+
     num_disintegratable_blocks = 0
     for i, block in enumerate(tqdm(blocks)):
         other_blocks = blocks.copy()
@@ -106,6 +112,8 @@ def get_num_disintegratable_blocks(blocks: List[Tuple[List[int], List[int], List
 
 
 def get_num_overall_falling_blocks(blocks: List[Tuple[List[int], List[int], List[int]]]) -> int:
+    from tqdm import tqdm
+
     num_falling_blocks = 0
     for i, block in enumerate(tqdm(blocks)):
         other_blocks = blocks.copy()
@@ -119,8 +127,7 @@ def get_num_overall_falling_blocks(blocks: List[Tuple[List[int], List[int], List
 
 
 if __name__ == "__main__":
-    with open("../inputs/input22.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input22.txt")
 
     # PART 1
     start = time.perf_counter()
@@ -1,9 +1,11 @@
 from __future__ import annotations
-import re
 import time
 
 import numpy as np
 
+from grid import load_grid, translate_grid
+from puzzle_input import InputFile, Source
+
 EXAMPLE1 = """
 #.#####################
 #.......#########...###
@@ -30,6 +32,13 @@ EXAMPLE1 = """
 #####################.#
 """
 
+# Comparing numpy uint8 scalars with Python ints is an order of magnitude slower than comparing them with uint8 scalars
+PATH = np.uint8(ord("."))
+SLOPE_RIGHT = np.uint8(ord(">"))
+SLOPE_LEFT = np.uint8(ord("<"))
+SLOPE_DOWN = np.uint8(ord("v"))
+SLOPE_UP = np.uint8(ord("^"))
+
 DISPLACEMENTS = [
     (lambda c: (c[0], c[1] - 1)),
     (lambda c: (c[0], c[1] + 1)),
@@ -38,20 +47,18 @@ DISPLACEMENTS = [
 ]
 
 
-def parse_input(text: str, ignore_slopes: bool = False) -> np.ndarray:
-    grid = []
-    for line in text.strip().split("\n"):
-        if ignore_slopes:
-            line = re.sub(r"[<>v^]", ".", line)
-        grid.append(list(line.strip()))
+def parse_input(text: Source, ignore_slopes: bool = False) -> np.ndarray:
+    grid = load_grid(text)
+    if ignore_slopes:
+        grid = translate_grid(grid, {c: PATH if c in "<>v^" else ord(c) for c in "#.<>v^"})
 
-    return np.array(grid)
+    return grid
 
 
 def find_start_and_end_coordinates(hiking_map: np.ndarray) -> tuple[tuple[int, int]]:
     i_max = hiking_map.shape[0]
-    start_pos = (0, np.where(hiking_map[0, :] == ".")[0][0])
-    end_pos = (i_max - 1, np.where(hiking_map[-1, :] == ".")[0][0])
+    start_pos = (0, np.where(hiking_map[0, :] == PATH)[0][0])
+    end_pos = (i_max - 1, np.where(hiking_map[-1, :] == PATH)[0][0])
 
     # noinspection PyTypeChecker
     return start_pos, end_pos
@@ -90,11 +97,11 @@ def build_map_graph(
                     0 <= next_pos[0] < i_max and 0 <= next_pos[1] < j_max and
                     next_pos not in visited_positions_on_way_to_next_node and
                     (
-                        hiking_map[next_pos] == "." or
-                        (hiking_map[next_pos] == ">" and next_pos[1] > pos[1]) or
-                        (hiking_map[next_pos] == "<" and next_pos[1] < pos[1]) or
-                        (hiking_map[next_pos] == "v" and next_pos[0] > pos[0]) or
-                        (hiking_map[next_pos] == "^" and next_pos[0] < pos[0])
+                        hiking_map[next_pos] == PATH or
+                        (hiking_map[next_pos] == SLOPE_RIGHT and next_pos[1] > pos[1]) or
+                        (hiking_map[next_pos] == SLOPE_LEFT and next_pos[1] < pos[1]) or
+                        (hiking_map[next_pos] == SLOPE_DOWN and next_pos[0] > pos[0]) or
+                        (hiking_map[next_pos] == SLOPE_UP and next_pos[0] < pos[0])
                     )
                 ):
                     next_possible_positions.append(next_pos)
@@ -142,8 +149,7 @@ def find_longest_path(
 
 
 if __name__ == "__main__":
-    with open("../inputs/input23.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input23.txt")
 
     # PART 1
     start = time.perf_counter()
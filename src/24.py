@@ -3,7 +3,8 @@ import time
 
 import numpy as np
 from numpy.linalg import LinAlgError
-import sympy as sp
+
+from puzzle_input import InputFile, Source, iter_lines
 
 EXAMPLE1 = """
 19, 13, 30 @ -2,  1, -2
@@ -14,9 +15,9 @@ EXAMPLE1 = """
 """
 
 
-def parse_input(text: str, ignore_z: bool = True) -> list[tuple[np.ndarray, np.ndarray]]:
+def parse_input(text: Source, ignore_z: bool = True) -> list[tuple[np.ndarray, np.ndarray]]:
     hailstones = []
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         p_text, v_text = line.strip().split(" @ ")
         p = np.array(list(map(int, p_text.split(", "))))
         v = np.array(list(map(int, v_text.split(", "))))
@@ -78,6 +79,7 @@ def get_initial_coordinates_of_rock(
     sympy) in a reasonable amount of time. However, it turns out that only four hailstones need to be considered for the
     solution to be unique.
     """
+    import sympy as sp  # Imported on first use, as importing sympy takes longer than solving part 1
 
     x_r, y_r, z_r, u_r, v_r, w_r = sp.symbols("x_r, y_r, z_r, u_r, v_r, w_r")
     eqs = []
@@ -105,8 +107,7 @@ def get_num_intersecting_trajectories(
 
 
 if __name__ == "__main__":
-    with open("../inputs/input24.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input24.txt")
 
     # PART 1
     start = time.perf_counter()
@@ -1,8 +1,10 @@
 import copy
+import math
+import random
 import time
 
-import numpy as np
-from tqdm import tqdm
+from instrumentation import profiled
+from puzzle_input import InputFile, Source, iter_lines
 
 EXAMPLE1 = """
 jqt: rhn xhk nvd
@@ -20,35 +22,36 @@ rzs: qnr cmg lsr rsh
 frs: qnr lhk lsr
 """
 
-NODE_INDEX = {}
 
-
-def parse_input(text: str) -> dict[int, list[int]]:
+def parse_input(text: Source) -> dict[int, list[int]]:
+    # Local to the parse, so that long-running processes (see daemon.py) don't accumulate the nodes of every input
+    node_index = {}
     graph = {}
-    for line in text.strip().split("\n"):
+    for line in iter_lines(text):
         key, vals = line.strip().split(": ")
         vals = list(vals.strip().split(" "))
-        key_id = get_node_id(key)
-        val_ids = [get_node_id(val) for val in vals]
+        key_id = get_node_id(key, node_index)
+        val_ids = [get_node_id(val, node_index) for val in vals]
         graph[key_id] = val_ids
 
     return graph
 
 
-def get_node_id(node_name: str) -> int:
-    if node_name in NODE_INDEX.keys():
-        return NODE_INDEX[node_name]
+def get_node_id(node_name: str, node_index: dict[str, int]) -> int:
+    if node_name in node_index.keys():
+        return node_index[node_name]
     else:
-        next_id = len(NODE_INDEX)
-        NODE_INDEX[node_name] = next_id
+        next_id = len(node_index)
+        node_index[node_name] = next_id
         return next_id
 
 
+@profiled
 def contract_random_edge(graph: dict[int, list[int]], node_weights: dict[str, int]) -> dict[int, list[int]]:
-    node_keep = np.random.choice(list(graph.keys()))
+    node_keep = random.choice(list(graph.keys()))
     while not graph[node_keep]:
-        node_keep = np.random.choice(list(graph.keys()))
-    node_drop = np.random.choice(graph[node_keep])
+        node_keep = random.choice(list(graph.keys()))
+    node_drop = random.choice(graph[node_keep])
     graph[node_keep] = graph[node_keep] + graph.pop(node_drop, [])
     for key, vals in graph.items():
         graph[key] = [
@@ -88,12 +91,14 @@ def contract_graph(
 
 
 def get_three_cut_and_multiply_subgraph_sizes(graph: dict[int, list[int]], num_tries: int = 10) -> int:
+    from tqdm import tqdm  # Importing tqdm at module level would take longer than parsing the input
+
     for _ in tqdm(range(num_tries)):
         new_graph = copy.deepcopy(graph)
         new_graph, node_weights = fast_min_cut(new_graph)
         if get_num_edges(new_graph) == 3:
             if len(node_weights) <= 2:
-                prod = int(np.prod(np.array(list(node_weights.values()))))
+                prod = math.prod(node_weights.values())
             else:
                 raise ValueError("Too may node weights remained after graph contraction!")
             return prod
@@ -112,7 +117,7 @@ def fast_min_cut(
     if num_nodes <= 6:
         return contract_graph(graph, node_weights)
     else:
-        t = int(np.ceil(decay_fac * (1 + num_nodes / np.sqrt(2))))
+        t = math.ceil(decay_fac * (1 + num_nodes / math.sqrt(2)))
         result = fast_min_cut(*contract_graph(copy.deepcopy(graph), node_weights.copy(), t))
         if get_num_edges(result[0]) == 3:
             # Three-cut found (due to the specific problem input, there must exist one). Hence, we can abort early
@@ -124,8 +129,7 @@ def fast_min_cut(
 
 
 if __name__ == "__main__":
-    with open("../inputs/input25.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input25.txt")
 
     # PART 1
     start = time.perf_counter()
@@ -1,5 +1,16 @@
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
 import numpy
 
+from grid import load_grid
+from puzzle_input import InputFile, Source, iter_lines
+
+GEAR = "*"
+DOT = ord(".")
+ZERO = ord("0")
+NINE = ord("9")
+
 EXAMPLE1 = """
 467..114..
 ...*......
@@ -14,110 +25,196 @@ EXAMPLE1 = """
 """
 
 
-def get_special_symbols(input_text):
-    return {c for c in input_text if not (str.isdigit(c) or c in (".", "\n"))}
-
-
-def get_number_coordinates(input_matrix):
-    number_coords = []
-    reversed_number_coord_ids = {}
-    number_ids = {}
-    number_id_counter = 0
-
-    def update_reversed_number_coords(row_idx, col_idx_left, col_idx_right, value, id_counter):
-        for k in range(col_idx_left, col_idx_right + 1):
-            reversed_number_coord_ids[(row_idx, k)] = id_counter
-        number_ids[id_counter] = value
-
-        return id_counter + 1
-
-    num_rows, num_cols = input_matrix.shape
-    for i in range(num_rows):
-        found_number = ""
-        start_idx = 0
-        for j in range(num_cols):
-            char = input_matrix[i, j]
-            if str.isdigit(char):
-                if found_number == "":
-                    start_idx = j
-                found_number += char
-            else:
-                if found_number != "":
-                    number_coords.append([int(found_number), i, start_idx, j - 1])
-                    number_id_counter = update_reversed_number_coords(
-                        i, start_idx, j - 1, int(found_number), number_id_counter
-                    )
-                    found_number = ""
-            if j == num_cols - 1 and found_number != "":
-                number_coords.append([int(found_number), i, start_idx, j])
-                number_id_counter = update_reversed_number_coords(
-                    i, start_idx, j, int(found_number), number_id_counter
-                )
-
-    return number_coords, reversed_number_coord_ids, number_ids
+def get_digit_mask(input_matrix):
+    return (input_matrix >= ZERO) & (input_matrix <= NINE)
+
+
+def get_symbol_mask(input_matrix):
+    return ~get_digit_mask(input_matrix) & (input_matrix != DOT)
+
+
+def dilate(mask):
+    """
+    Set all cells of the boolean mask that have a set cell among their 8 neighbors.
+    """
+    res = mask.copy()
+    res[1:, :] |= mask[:-1, :]
+    res[:-1, :] |= mask[1:, :]
+    vertically_dilated = res.copy()
+    res[:, 1:] |= vertically_dilated[:, :-1]
+    res[:, :-1] |= vertically_dilated[:, 1:]
+
+    return res
+
+
+def get_number_labels(input_matrix):
+    """
+    Label each digit cell with the (1-based) id of the number it belongs to and all other cells with 0. Returns the
+    labels and the values of the numbers (the value of the number with id n at index n - 1).
+    """
+    digit_mask = get_digit_mask(input_matrix)
+    # Numbers are runs of digits within a row
+    run_starts = digit_mask.copy()
+    run_starts[:, 1:] &= ~digit_mask[:, :-1]
+    labels = numpy.cumsum(run_starts, dtype=numpy.int32).reshape(input_matrix.shape)
+    labels[~digit_mask] = 0
+
+    # All digits in row-major order, i.e., number by number
+    digits = input_matrix[digit_mask].astype(numpy.int64) - ZERO
+    if len(digits) == 0:
+        return labels, numpy.zeros(0, dtype=numpy.int64)
+    start_indices = numpy.flatnonzero(run_starts[digit_mask])
+    run_lengths = numpy.diff(start_indices, append=len(digits))
+    positions_in_run = numpy.arange(len(digits)) - numpy.repeat(start_indices, run_lengths)
+    place_values = 10 ** (numpy.repeat(run_lengths, run_lengths) - 1 - positions_in_run)
+    values = numpy.add.reduceat(digits * place_values, start_indices)
+
+    return labels, values
 
 
 def get_schematic_matrix(input_text):
-    input_arr = input_text.strip().split("\n")
-    mat = numpy.empty((len(input_arr), len(input_arr[0])), dtype='str')
-    for i, line in enumerate(input_arr):
-        for j, char in enumerate(line):
-            mat[i, j] = char
-
-    return mat
-
-
-def get_part_numbers(number_coords, overall_matrix, special_syms):
-    part_numbers = []
-    # Pad matrix with "." symbols, so that we don't have to deal with boundary edge cases
-    overall_matrix = numpy.pad(overall_matrix, 1, constant_values=".")
-    for item in number_coords:
-        number = item[0]
-        # Index needs to be shifted due to padding of the original matrix
-        i = item[1] + 1
-        j_left = item[2] + 1
-        j_right = item[3] + 1
-        neighbor_coords = [(i, j_left - 1), (i, j_right + 1)]
-        for n in range(j_left - 1, j_right + 2):
-            neighbor_coords.extend([(i - 1, n), (i + 1, n)])
-        for i, j in neighbor_coords:
-            if overall_matrix[i, j] in special_syms:
-                part_numbers.append(number)
-                break
-
-    return part_numbers
-
-
-def get_gear_ratios(input_matrix, reversed_number_coord_ids, number_ids):
-    gear_ratios = []
-    num_rows, num_cols = input_matrix.shape
-    for i in range(num_rows):
-        for j in range(num_cols):
-            char = input_matrix[i, j]
-            if char == "*":
-                neighbor_coords = [(i, j - 1), (i, j + 1)]
-                for n in range(j - 1, j + 2):
-                    neighbor_coords.extend([(i - 1, n), (i + 1, n)])
-                gear_number_ids = set()
-                for n, m in neighbor_coords:
-                    gear_number = reversed_number_coord_ids.get((n, m))
-                    if gear_number is not None:
-                        gear_number_ids.add(gear_number)
-                if len(gear_number_ids) == 2:
-                    gear_ratios.append(numpy.prod([number_ids[num_id] for num_id in gear_number_ids]))
-
-    return gear_ratios
+    return load_grid(input_text)
+
+
+def get_part_numbers(input_matrix):
+    labels, values = get_number_labels(input_matrix)
+    # A number is a part number if any of its digits lies next to a symbol
+    labels_next_to_symbol = labels[dilate(get_symbol_mask(input_matrix))]
+    is_part_number = numpy.bincount(labels_next_to_symbol, minlength=len(values) + 1)[1:] > 0
+
+    return values[is_part_number]
+
+
+class SchematicIndex(NamedTuple):
+    # Number ids of the cells (see get_number_labels), with a border of zeros around the schematic
+    padded_labels: numpy.ndarray
+    values: numpy.ndarray
+    # Rows and columns (in the unpadded schematic) of each type of symbol
+    symbol_positions: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+
+
+# Offsets of the 8 neighbors of a cell
+NEIGHBOR_ROW_OFFSETS = numpy.array([-1, -1, -1, 0, 0, 1, 1, 1])
+NEIGHBOR_COL_OFFSETS = numpy.array([-1, 0, 1, -1, 1, -1, 0, 1])
+
+
+def get_schematic_index(input_matrix) -> SchematicIndex:
+    labels, values = get_number_labels(input_matrix)
+    rows, cols = numpy.nonzero(get_symbol_mask(input_matrix))
+    symbols = input_matrix[rows, cols]
+    symbol_positions = {}
+    for symbol in numpy.unique(symbols).tolist():
+        is_symbol = symbols == symbol
+        symbol_positions[chr(symbol)] = (rows[is_symbol], cols[is_symbol])
+
+    return SchematicIndex(numpy.pad(labels, 1), values, symbol_positions)
+
+
+def get_adjacent_number_ids(index: SchematicIndex, symbol: str):
+    """
+    Ids of the distinct numbers adjacent to each occurrence of the symbol, as one row of 8 (sorted) ids per occurrence
+    that is filled up with zeros.
+    """
+    rows, cols = index.symbol_positions.get(symbol, (numpy.zeros(0, dtype=int), numpy.zeros(0, dtype=int)))
+    # + 1 for the border of the padded labels
+    neighbor_ids = numpy.sort(
+        index.padded_labels[rows[:, None] + 1 + NEIGHBOR_ROW_OFFSETS, cols[:, None] + 1 + NEIGHBOR_COL_OFFSETS], axis=1
+    )
+    # A number can touch a symbol with up to three digits
+    neighbor_ids[:, 1:][neighbor_ids[:, 1:] == neighbor_ids[:, :-1]] = 0
+
+    return neighbor_ids
+
+
+def get_symbol_ratios(index: SchematicIndex, symbol: str, num_numbers: int):
+    """
+    Products of the adjacent numbers of all occurrences of the symbol that are adjacent to exactly num_numbers numbers.
+    """
+    neighbor_ids = get_adjacent_number_ids(index, symbol)
+    neighbor_ids = neighbor_ids[numpy.count_nonzero(neighbor_ids, axis=1) == num_numbers]
+    # Id 0 stands for no number and is mapped to the neutral factor 1
+    factors = numpy.concatenate(([1], index.values))[neighbor_ids]
+
+    return factors.prod(axis=1)
+
+
+def get_gear_ratios(index: SchematicIndex):
+    return get_symbol_ratios(index, GEAR, 2)
+
+
+NUMBER_PATTERN = re.compile(r"\d+")
+GEAR_PATTERN = re.compile(re.escape(GEAR))
+# Maps every symbol to "#", and digits and "." to "."
+SYMBOL_TABLE = str.maketrans({chr(c): "." if chr(c).isdigit() or chr(c) == "." else "#" for c in range(128)})
+
+PART_NUMBER = "part_number"
+GEAR_RATIO = "gear_ratio"
+
+
+class SchematicRow(NamedTuple):
+    # Start (inclusive), end (exclusive), and value of each number
+    numbers: List[Tuple[int, int, int]]
+    # The row with all symbols replaced by "#" and everything else by "."
+    symbols: str
+    gear_columns: List[int]
+
+
+def scan_row(line: str) -> SchematicRow:
+    # iter_lines keeps the carriage returns of CRLF line breaks, which would count as symbols otherwise
+    line = line.rstrip("\r")
+    return SchematicRow(
+        [(match.start(), match.end(), int(match.group())) for match in NUMBER_PATTERN.finditer(line)],
+        line.translate(SYMBOL_TABLE),
+        [match.start() for match in GEAR_PATTERN.finditer(line)],
+    )
+
+
+def _evaluate_row(
+        above: Optional[SchematicRow], row: SchematicRow, below: Optional[SchematicRow]
+) -> Iterator[Tuple[str, int]]:
+    window = [r for r in (above, row, below) if r is not None]
+    for start, end, value in row.numbers:
+        if any("#" in r.symbols[max(start - 1, 0):end + 1] for r in window):
+            yield PART_NUMBER, value
+    for col in row.gear_columns:
+        adjacent_numbers = [value for r in window for start, end, value in r.numbers if start - 1 <= col <= end]
+        if len(adjacent_numbers) == 2:
+            yield GEAR_RATIO, adjacent_numbers[0] * adjacent_numbers[1]
+
+
+def stream_schematic(input_text: Source) -> Iterator[Tuple[str, int]]:
+    """
+    Streaming alternative to the grid-based functions above: the schematic is read line by line, and only a window of
+    three scanned rows is kept. Each row's part numbers and gear ratios are emitted as (PART_NUMBER, value) and
+    (GEAR_RATIO, value) as soon as the row below it has been read, so the memory usage only depends on the width.
+    """
+    above = row = None
+    for line in iter_lines(input_text):
+        below = scan_row(line)
+        if row is not None:
+            yield from _evaluate_row(above, row, below)
+        above, row = row, below
+    if row is not None:
+        yield from _evaluate_row(above, row, None)
+
+
+def sum_streamed_schematic(input_text: Source) -> Tuple[int, int]:
+    sums = {PART_NUMBER: 0, GEAR_RATIO: 0}
+    for kind, value in stream_schematic(input_text):
+        sums[kind] += value
+
+    return sums[PART_NUMBER], sums[GEAR_RATIO]
 
 
 if __name__ == '__main__':
-    with open("../inputs/input3.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input3.txt")
 
     # PART 1
     matrix = get_schematic_matrix(in_text)
-    number_coordinates, reversed_number_coordinate_ids, number_id_dict = get_number_coordinates(matrix)
-    special_symbols = get_special_symbols(in_text)
-    print(sum(get_part_numbers(number_coordinates, matrix, special_symbols)))
+    print(get_part_numbers(matrix).sum())
 
     # PART 2
-    print(sum(get_gear_ratios(matrix, reversed_number_coordinate_ids, number_id_dict)))
+    print(get_gear_ratios(get_schematic_index(matrix)).sum())
+
+    # BOTH PARTS IN STREAMING MODE
+    print(sum_streamed_schematic(in_text))
@@ -1,5 +1,11 @@
-import math
 import re
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from grid import load_grid
+from puzzle_input import InputFile, iter_lines
 
 EXAMPLE1 = """
 Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
@@ -11,53 +17,215 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
 """
 
 
-def read_cards(input_text):
+CARD_PATTERN = re.compile(r"Card\s+\d+:((?:\s+\d+)+)\s+\|((?:\s+\d+)+)")
+
+COLON = ord(":")
+BAR = ord("|")
+SPACE = ord(" ")
+ZERO = ord("0")
+
+
+def _read_number_fields(fields: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Numbers of an (n, 3 * k) array of fields " dd" (or "  d"), or None if the fields don't look like that.
+    """
+    if fields.shape[1] % 3 != 0:
+        return None
+    fields = np.ascontiguousarray(fields).reshape(len(fields), -1, 3)
+    # Characters below "0" wrap around to large values
+    tens = fields[:, :, 1] - np.uint8(ZERO)
+    ones = fields[:, :, 2] - np.uint8(ZERO)
+    is_tens_space = fields[:, :, 1] == SPACE
+    if not ((fields[:, :, 0] == SPACE).all() and (ones <= 9).all() and ((tens <= 9) | is_tens_space).all()):
+        return None
+    tens[is_tens_space] = 0
+
+    return tens * np.uint8(10) + ones
+
+
+def _read_fixed_width_cards(input_text) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Fast path for the usual layout, in which the numbers of all cards are right-aligned in columns of width 3, so that
+    all cards can be parsed at once from the character grid. Returns None for any other layout.
+    """
+    try:
+        grid = load_grid(input_text)
+    except ValueError:  # Lines of different lengths
+        return None
+    colon_col = int(np.argmax(grid[0] == COLON))
+    bar_col = int(np.argmax(grid[0] == BAR))
+    if not (grid[0, colon_col] == COLON and 0 < colon_col < bar_col and (grid[:, colon_col] == COLON).all()
+            and (grid[:, bar_col] == BAR).all()):
+        return None
+    winning_nums = _read_number_fields(grid[:, colon_col + 1:bar_col - 1])
+    drawn_nums = _read_number_fields(grid[:, bar_col + 1:])
+    if winning_nums is None or drawn_nums is None:
+        return None
+
+    return winning_nums, drawn_nums
+
+
+def _pad_rows(rows: List[List[int]], fill_value: int) -> np.ndarray:
+    nums = np.full((len(rows), max(map(len, rows), default=0)), fill_value, dtype=np.int64)
+    for i, row in enumerate(rows):
+        nums[i, :len(row)] = row
+
+    return nums
+
+
+def _read_cards_with_regex(input_text) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fallback for any other layout. Cards may have different numbers of winning and drawn numbers, so shorter rows are
+    padded, with two different numbers above all others, which never match each other.
+    """
     winning_nums = []
     drawn_nums = []
-    for line in input_text.strip().split("\n"):
-        winning_numbers_match = re.match(r"Card\s+\d+:((?:\s+\d+)+)\s+\|", line)
-        drawn_numbers_match = re.search(r"\|((?:\s+\d+)+)", line)
+    for line in iter_lines(input_text):
+        winning_numbers, drawn_numbers = CARD_PATTERN.match(line).groups()
+        winning_nums.append(list(map(int, winning_numbers.split())))
+        drawn_nums.append(list(map(int, drawn_numbers.split())))
+    max_num = max(max(row) for row in winning_nums + drawn_nums)
 
-        winning_nums.append([int(x) for x in winning_numbers_match.groups()[0].strip().split()])
-        drawn_nums.append([int(x) for x in drawn_numbers_match.groups()[0].strip().split()])
+    return _pad_rows(winning_nums, max_num + 1), _pad_rows(drawn_nums, max_num + 2)
 
-    return winning_nums, drawn_nums
 
+def read_cards(input_text) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Winning and drawn numbers of all cards, as arrays with one row per card.
+    """
+    nums = _read_fixed_width_cards(input_text)
+
+    return nums if nums is not None else _read_cards_with_regex(input_text)
+
+
+def _get_flat_indices(nums: np.ndarray, num_values: int) -> np.ndarray:
+    # Indices of the numbers in the flattened (n, num_values) matrix with one row per card
+    return np.arange(0, len(nums) * num_values, num_values, dtype=np.intp)[:, None] + nums
+
+
+def to_bool_matrix(nums: np.ndarray, num_values: int) -> np.ndarray:
+    """
+    Boolean (n, num_values) matrix marking the numbers of each row of the (n, k) array of numbers.
+    """
+    matrix = np.zeros(len(nums) * num_values, dtype=bool)
+    matrix[_get_flat_indices(nums, num_values)] = True
+
+    return matrix.reshape(len(nums), num_values)
 
-def get_card_worths(winning_nums, drawn_nums):
-    card_worths = []
-    for wins, drawns in zip(winning_nums, drawn_nums):
-        card_worth = 0
-        for drawn in drawns:
-            if drawn in wins:
-                if card_worth == 0:
-                    card_worth = 1
-                else:
-                    card_worth *= 2
-        card_worths.append(card_worth)
 
-    return card_worths
+def get_match_counts(winning_nums: np.ndarray, drawn_nums: np.ndarray) -> np.ndarray:
+    num_values = int(max(winning_nums.max(initial=0), drawn_nums.max(initial=0))) + 1
+    winning_matrix = to_bool_matrix(winning_nums, num_values)
+    # Whether each drawn number is among the winning numbers of its card
+    is_winning = winning_matrix.reshape(-1)[_get_flat_indices(drawn_nums, num_values)]
 
+    return np.count_nonzero(is_winning, axis=1)
 
-def get_number_of_cards(card_worths):
-    num_cards = [1] * len(card_worths)
-    for i, (worth_current_card, num_current_card) in enumerate(zip(card_worths, num_cards)):
-        num_wins = int(math.log2(2 * worth_current_card)) if worth_current_card >= 1 else 0
-        for j in range(num_wins):
-            if i + 1 + j < len(card_worths):
-                num_cards[i + 1 + j] += num_current_card
+
+def get_card_worths(match_counts: np.ndarray) -> np.ndarray:
+    return np.where(match_counts > 0, np.left_shift(1, match_counts - 1, dtype=np.int64), 0)
+
+
+def get_number_of_cards(match_counts: np.ndarray) -> List[int]:
+    """
+    Number of instances of each card. A card adds its instances to the next cards by means of a difference array, so
+    that every card is visited only once, no matter how many cards it wins.
+    """
+    num_total_cards = len(match_counts)
+    # The numbers of instances can grow beyond 64 bits, hence Python ints
+    additional_cards = [0] * (num_total_cards + 1)
+    num_cards = [0] * num_total_cards
+    num_current_card = 1
+    for i, num_wins in enumerate(match_counts.tolist()):
+        num_current_card += additional_cards[i]
+        num_cards[i] = num_current_card
+        if num_wins:
+            additional_cards[i + 1] += num_current_card
+            additional_cards[min(i + 1 + num_wins, num_total_cards)] -= num_current_card
 
     return num_cards
 
 
+# Streaming alternative to the functions above: one generator stage per step, with memory bounded by the largest number
+# of matches instead of the number of cards
+
+
+# Bit of each number the puzzle uses, looked up by the number's string, which saves the int conversions. Any other
+# number is converted on the fly, so that the table doesn't grow with the inputs.
+NUMBER_BITS = {str(num): 1 << num for num in range(100)}
+
+
+def get_number_bit(num: str) -> int:
+    return NUMBER_BITS.get(num) or 1 << int(num)
+
+
+def to_bitmask(nums: Iterable[str]) -> int:
+    mask = 0
+    for num in nums:
+        # get_number_bit, inlined for speed
+        mask |= NUMBER_BITS.get(num) or 1 << int(num)
+
+    return mask
+
+
+def iter_cards(input_text) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Winning numbers of one card after the other as a bitmask, together with the card's drawn numbers.
+    """
+    for line in iter_lines(input_text):
+        winning_numbers, _, drawn_numbers = line.partition(":")[2].partition("|")
+        yield to_bitmask(winning_numbers.split()), drawn_numbers.split()
+
+
+def iter_match_counts(cards: Iterable[Tuple[int, List[str]]]) -> Iterator[int]:
+    for winning_mask, drawn_numbers in cards:
+        drawn_mask = to_bitmask(drawn_numbers)
+        num_matches = (winning_mask & drawn_mask).bit_count()
+        if drawn_mask.bit_count() < len(drawn_numbers):
+            # Like in get_match_counts, every occurrence of a repeated drawn number counts
+            num_matches = sum(1 for num in drawn_numbers if get_number_bit(num) & winning_mask)
+        yield num_matches
+
+
+def iter_number_of_cards(match_counts: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Number of matches and number of instances of one card after the other. The difference array of get_number_of_cards
+    only ever reaches as far ahead as the current card's matches, so a deque covering that window is all that is kept.
+    """
+    # Changes of the number of additional instances, starting with the next card
+    additional_cards = deque()
+    num_current_card = 1
+    for num_wins in match_counts:
+        if additional_cards:
+            num_current_card += additional_cards.popleft()
+        if num_wins:
+            if len(additional_cards) <= num_wins:
+                additional_cards.extend([0] * (num_wins + 1 - len(additional_cards)))
+            additional_cards[0] += num_current_card
+            additional_cards[num_wins] -= num_current_card
+        yield num_wins, num_current_card
+
+
+def sum_streamed_cards(input_text) -> Tuple[int, int]:
+    total_worth = 0
+    total_cards = 0
+    for num_wins, num_cards in iter_number_of_cards(iter_match_counts(iter_cards(input_text))):
+        if num_wins:
+            total_worth += 1 << (num_wins - 1)
+        total_cards += num_cards
+
+    return total_worth, total_cards
+
+
 if __name__ == "__main__":
-    with open("../inputs/input4.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input4.txt")
 
     # PART 1
-    winning_numbers, drawn_numbers = read_cards(in_text)
-    worths = get_card_worths(winning_numbers, drawn_numbers)
-    print(sum(worths))
+    matches = get_match_counts(*read_cards(in_text))
+    print(get_card_worths(matches).sum())
 
     # PART 2
-    print(sum(get_number_of_cards(worths)))
+    print(sum(get_number_of_cards(matches)))
+
+    # BOTH PARTS IN STREAMING MODE
+    print(sum_streamed_cards(in_text))
@@ -1,4 +1,13 @@
-import copy
+from bisect import bisect_right
+from functools import reduce
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from puzzle_input import InputFile, iter_blocks
+
+# Number of seeds mapped at once by the bulk functions, which bounds their temporary arrays
+DEFAULT_CHUNK_SIZE = 1 << 20
 
 EXAMPLE1 = """
 seeds: 79 14 55 13
@@ -38,14 +47,13 @@ humidity-to-location map:
 
 
 def parse_input(text, seed_ranges=False):
-    blocks = text.split("\n\n")
+    blocks = iter_blocks(text)
     maps = []
-    seeds = list(map(lambda s: int(s.strip()), blocks[0].strip().replace("seeds: ", "").split(" ")))
+    seeds = list(map(lambda s: int(s.strip()), next(blocks)[0].strip().replace("seeds: ", "").split(" ")))
     if seed_ranges:
         seeds = [[seeds[i], seeds[i] + seeds[i + 1] - 1] for i in range(0, len(seeds), 2)]
-    for i, block in enumerate(blocks[1:]):
+    for i, lines in enumerate(blocks):
         maps.append([])
-        lines = block.strip().split("\n")
         for line in lines[1:]:
             tgt_start, src_start, num_range = map(lambda s: int(s.strip()), line.strip().split(" "))
             src_end = src_start + num_range - 1
@@ -55,59 +63,178 @@ def parse_input(text, seed_ranges=False):
     return seeds, maps
 
 
+class PiecewiseMap(NamedTuple):
+    """
+    Map adding shifts[i] to all numbers x with starts[i - 1] <= x < starts[i], i.e., shifts[0] applies below starts[0]
+    and shifts[-1] from starts[-1] on.
+    """
+    starts: List[int]
+    shifts: List[int]
+
+
+def _merge_segments(starts, shifts) -> PiecewiseMap:
+    # Drop the breakpoints between neighboring segments with the same shift
+    merged_starts = []
+    merged_shifts = [shifts[0]]
+    for start, shift in zip(starts, shifts[1:]):
+        if shift != merged_shifts[-1]:
+            merged_starts.append(start)
+            merged_shifts.append(shift)
+
+    return PiecewiseMap(merged_starts, merged_shifts)
+
+
+def to_piecewise_map(mapping_set) -> PiecewiseMap:
+    starts = []
+    shifts = [0]
+    for src_start, src_end, shift in sorted(mapping_set):
+        if starts and starts[-1] == src_start:
+            # The previous mapping ends right where this one starts
+            shifts[-1] = shift
+        else:
+            starts.append(src_start)
+            shifts.append(shift)
+        starts.append(src_end + 1)
+        shifts.append(0)
+
+    return _merge_segments(starts, shifts)
+
+
+def compose(first: PiecewiseMap, second: PiecewiseMap) -> PiecewiseMap:
+    """
+    Piecewise map of applying first and then second. Each segment of first is split where its image crosses a
+    breakpoint of second.
+    """
+    starts = []
+    shifts = []
+    for i, shift in enumerate(first.shifts):
+        lower = first.starts[i - 1] if i > 0 else None
+        upper = first.starts[i] if i < len(first.starts) else None
+        j = bisect_right(second.starts, lower + shift) if lower is not None else 0
+        if lower is not None:
+            starts.append(lower)
+        shifts.append(shift + second.shifts[j])
+        while j < len(second.starts) and (upper is None or second.starts[j] < upper + shift):
+            starts.append(second.starts[j] - shift)
+            shifts.append(shift + second.shifts[j + 1])
+            j += 1
+
+    return _merge_segments(starts, shifts)
+
+
+def get_almanac_map(maps) -> PiecewiseMap:
+    """
+    All mapping sets composed into a single map from seeds to locations, which can be reused for any number of seeds.
+    """
+    return reduce(compose, map(to_piecewise_map, maps), PiecewiseMap([], [0]))
+
+
+def map_seed(almanac_map: PiecewiseMap, seed: int) -> int:
+    return seed + almanac_map.shifts[bisect_right(almanac_map.starts, seed)]
+
+
 def get_locations(seeds, maps):
-    locations = []
-    for seed in seeds:
-        for mapping_set in maps:
-            for mapping in mapping_set:
-                src_start, src_end, shift = mapping
-                if src_start <= seed <= src_end:
-                    seed = seed + shift
-                    break
-        locations.append(seed)
+    almanac_map = get_almanac_map(maps)
+
+    return [map_seed(almanac_map, seed) for seed in seeds]
+
+
+def to_layer_arrays(mapping_set) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Source starts, source ends, and shifts of the mapping set as arrays, sorted by the source starts.
+    """
+    layer = np.array(sorted(mapping_set), dtype=np.int64).reshape(-1, 3)
+
+    return layer[:, 0].copy(), layer[:, 1].copy(), layer[:, 2].copy()
+
+
+def _map_chunk(seeds: np.ndarray, layers: List[Tuple[np.ndarray, np.ndarray, np.ndarray]]) -> np.ndarray:
+    for src_starts, src_ends, shifts in layers:
+        # The mapping with the last source start not above the seed is the only one that can contain it. Seeds below
+        # all mappings get the first one, which doesn't contain them either.
+        idx = np.maximum(np.searchsorted(src_starts, seeds, side="right") - 1, 0)
+        is_mapped = (seeds >= src_starts[idx]) & (seeds <= src_ends[idx])
+        seeds = seeds + np.where(is_mapped, shifts[idx], 0)
+
+    return seeds
+
 
-    return locations
+def iter_mapped_chunks(seeds, maps, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Locations of the seeds (an int64 array or anything convertible to one), chunk_size seeds at a time.
+    """
+    seeds = np.asarray(seeds, dtype=np.int64)
+    layers = [to_layer_arrays(mapping_set) for mapping_set in maps if mapping_set]
+    for i in range(0, len(seeds), chunk_size):
+        yield _map_chunk(seeds[i:i + chunk_size], layers)
 
 
-def get_location_ranges(seed_ranges, maps):
+def map_seed_array(seeds, maps, chunk_size: int = DEFAULT_CHUNK_SIZE, out: Optional[np.ndarray] = None) -> np.ndarray:
+    if out is None:
+        out = np.empty(len(seeds), dtype=np.int64)
+    for i, locations in enumerate(iter_mapped_chunks(seeds, maps, chunk_size)):
+        out[i * chunk_size:i * chunk_size + len(locations)] = locations
+
+    return out
+
+
+def get_min_location(seeds, maps, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    # Only one chunk of locations exists at a time
+    chunk_minima = (int(locations.min()) for locations in iter_mapped_chunks(seeds, maps, chunk_size))
+    min_location = min(chunk_minima, default=None)
+    if min_location is None:
+        raise ValueError("At least one seed is needed to find the lowest location.")
+
+    return min_location
+
+
+def coalesce(ranges) -> List[Tuple[int, int]]:
+    """
+    Sorted list of the disjoint, non-adjacent (inclusive) ranges covering the same numbers as the given ranges.
+    """
+    coalesced = []
+    for start, end in sorted(ranges):
+        if coalesced and start <= coalesced[-1][1] + 1:
+            if end > coalesced[-1][1]:
+                coalesced[-1] = (coalesced[-1][0], end)
+        else:
+            coalesced.append((start, end))
+
+    return coalesced
+
+
+def map_ranges(ranges: List[Tuple[int, int]], piecewise_map: PiecewiseMap) -> List[Tuple[int, int]]:
+    """
+    Images of the sorted, disjoint ranges under the map. Ranges and segments are swept through in a single merge, and
+    each range is split where it crosses a breakpoint of the map.
+    """
+    starts, shifts = piecewise_map
+    mapped_ranges = []
+    j = 0
+    for start, end in ranges:
+        while j < len(starts) and starts[j] <= start:
+            j += 1
+        while True:
+            piece_end = min(end, starts[j] - 1) if j < len(starts) else end
+            mapped_ranges.append((start + shifts[j], piece_end + shifts[j]))
+            if piece_end == end:
+                break
+            start = piece_end + 1
+            j += 1
+
+    return mapped_ranges
+
+
+def get_location_ranges(seed_ranges, maps) -> List[Tuple[int, int]]:
+    ranges = coalesce(seed_ranges)
     for mapping_set in maps:
-        iteration_seed_ranges = copy.deepcopy(seed_ranges)
-        seed_ranges = []
-        for seed_range in iteration_seed_ranges:
-            for mapping in mapping_set:
-                src_start, src_end, shift = mapping
-                seed_start, seed_end = seed_range
-                if src_start <= seed_start <= src_end:
-                    new_seed_start = seed_range[0] + shift
-                    if src_start <= seed_end <= src_end:
-                        new_seed_end = seed_range[1] + shift
-                    else:
-                        iteration_seed_ranges.append([src_end + 1, seed_end])
-                        new_seed_end = src_end + shift
-                    seed_ranges.append([new_seed_start, new_seed_end])
-                    break
-                elif src_start <= seed_end <= src_end:
-                    iteration_seed_ranges.append([seed_start, src_start - 1])
-                    new_seed_start = src_start + shift
-                    new_seed_end = seed_end + shift
-                    seed_ranges.append([new_seed_start, new_seed_end])
-                    break
-                elif seed_start < src_start and seed_end > src_end:
-                    iteration_seed_ranges.append([seed_start, src_start - 1])
-                    seed_ranges.append([src_end + 1, seed_end])
-                    new_seed_start = src_start + shift
-                    new_seed_end = src_end + shift
-                    seed_ranges.append([new_seed_start, new_seed_end])
-                    break
-            else:
-                seed_ranges.append(seed_range)
-
-    return seed_ranges
+        ranges = coalesce(map_ranges(ranges, to_piecewise_map(mapping_set)))
+
+    return ranges
 
 
 if __name__ == '__main__':
-    with open("../inputs/input5.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input5.txt")
 
     # PART 1
     print(min(get_locations(*parse_input(in_text))))
@@ -1,7 +1,12 @@
 import math
+import random
 import re
 import time
 
+import numpy as np
+
+from puzzle_input import InputFile, iter_lines
+
 EXAMPLE1 = """
 Time:      7  15   30
 Distance:  9  40  200
@@ -9,7 +14,7 @@ Distance:  9  40  200
 
 
 def parse_input(text):
-    lines = text.strip().split("\n")
+    lines = list(iter_lines(text))
     race_times = list(
         map(
             lambda s: int(s.strip()),
@@ -27,7 +32,7 @@ def parse_input(text):
 
 
 def parse_input_kerning(text):
-    lines = text.strip().split("\n")
+    lines = list(iter_lines(text))
     race_time = int(re.sub(r"\s+", "", lines[0].replace("Time:", "")))
     record_distance = int(re.sub(r"\s+", "", lines[1].replace("Distance:", "")))
 
@@ -57,32 +62,112 @@ def get_num_wins_using_basic_analysis(race):
     return num_wins
 
 
-if __name__ == "__main__":
-    with open("../inputs/input6.txt", "r") as fh:
-        in_text = fh.read()
+def get_num_wins_using_exact_analysis(race):
+    """
+    Same as get_num_wins_using_basic_analysis, but in integer arithmetic, so that it stays exact for arbitrarily large
+    race times and records. The integer square root can put the lower bound off by one, which is corrected by testing
+    the bound itself. The upper bound follows from the symmetry of x * (b - x).
+    """
+    b, c = race
+    if b < 0:
+        return 0
+    half = b // 2
+    if half * (b - half) <= c:
+        return 0
+    x_min = max((b - math.isqrt(b ** 2 - 4 * c)) // 2, 0)
+    while x_min * (b - x_min) <= c:
+        x_min += 1
+    while x_min > 0 and (x_min - 1) * (b - x_min + 1) > c:
+        x_min -= 1
 
-    # PART 1
-    print("==================== PART 2 ====================")
-    print("Brute force:")
-    start = time.time()
-    res = math.prod(get_num_wins_using_brute_force(r) for r in parse_input(in_text))
-    end = time.time()
-    print(f"\tResult: {res}\t\t time: {(end - start) * 1000:.3f} ms")
-    print("Basic analysis:")
+    return b - 2 * x_min + 1
+
+
+MAX_BATCH_RACE_TIME = 1 << 31
+
+
+def get_num_wins_batch(race_times, record_distances) -> np.ndarray:
+    """
+    Vectorized get_num_wins_using_exact_analysis for many races at once. Race times have to be below 2^31, so that all
+    products fit into 64 bits.
+    """
+    b = np.asarray(race_times, dtype=np.int64)
+    c = np.asarray(record_distances, dtype=np.int64)
+    if b.size and (b.min() < 0 or b.max() >= MAX_BATCH_RACE_TIME):
+        raise ValueError(f"Race times have to lie in [0, {MAX_BATCH_RACE_TIME}).")
+    half = b // 2
+    max_distance = half * (b - half)
+    has_wins = max_distance > c
+    # Records outside of [-1, max_distance] make no difference, but could overflow below
+    c = np.clip(c, -1, max_distance)
+    x_min = np.clip((b - np.sqrt((b * b - 4 * c).astype(np.float64)).astype(np.int64)) // 2, 0, half)
+    # The floating point square root can put the bound off by one in either direction
+    while True:
+        too_low = has_wins & (x_min * (b - x_min) <= c)
+        if not too_low.any():
+            break
+        x_min += too_low
+    while True:
+        too_high = has_wins & (x_min > 0) & ((x_min - 1) * (b - x_min + 1) > c)
+        if not too_high.any():
+            break
+        x_min -= too_high
+
+    return np.where(has_wins, b - 2 * x_min + 1, 0)
+
+
+def cross_check(num_races=10000, max_race_time=1000, seed=None):
+    """
+    Compare all solvers to the brute force solution on random races (including records with ties and without any wins)
+    and return the races any of them gets wrong.
+    """
+    rng = random.Random(seed)
+    races = []
+    for _ in range(num_races):
+        race_time = rng.randint(0, max_race_time)
+        races.append((race_time, rng.randint(-1, (race_time // 2) * (race_time - race_time // 2) + 1)))
+    batch_results = get_num_wins_batch(*zip(*races)).tolist()
+
+    mismatches = []
+    for race, batch_result in zip(races, batch_results):
+        expected = get_num_wins_using_brute_force(race)
+        if get_num_wins_using_exact_analysis(race) != expected or batch_result != expected:
+            mismatches.append(race)
+
+    return mismatches
+
+
+def time_solver(name, solve):
     start = time.time()
-    res = math.prod(get_num_wins_using_basic_analysis(r) for r in parse_input(in_text))
+    res = solve()
     end = time.time()
-    print(f"\tResult: {res}\t\t time: {(end - start) * 1000:.3f} ms")
+    print(f"{name}:\n\tResult: {res}\t\t time: {(end - start) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    in_text = InputFile("../inputs/input6.txt")
+
+    # PART 1
+    print("==================== PART 1 ====================")
+    time_solver("Brute force", lambda: math.prod(get_num_wins_using_brute_force(r) for r in parse_input(in_text)))
+    time_solver(
+        "Basic analysis", lambda: math.prod(get_num_wins_using_basic_analysis(r) for r in parse_input(in_text))
+    )
+    time_solver(
+        "Exact analysis", lambda: math.prod(get_num_wins_using_exact_analysis(r) for r in parse_input(in_text))
+    )
+    time_solver("Batch analysis", lambda: math.prod(get_num_wins_batch(*zip(*parse_input(in_text))).tolist()))
 
     # PART 2
-    print("\n==================== PART 1 ====================")
-    print("Brute force:")
-    start = time.time()
-    res = get_num_wins_using_brute_force(parse_input_kerning(in_text))
-    end = time.time()
-    print(f"\tResult: {res}\t\t time: {(end - start) * 1000:.3f} ms")
-    print("Basic analysis:")
-    start = time.time()
-    res = get_num_wins_using_basic_analysis(parse_input_kerning(in_text))
-    end = time.time()
-    print(f"\tResult: {res}\t\t time: {(end - start) * 1000:.3f} ms")
+    print("\n==================== PART 2 ====================")
+    time_solver("Brute force", lambda: get_num_wins_using_brute_force(parse_input_kerning(in_text)))
+    time_solver("Basic analysis", lambda: get_num_wins_using_basic_analysis(parse_input_kerning(in_text)))
+    time_solver("Exact analysis", lambda: get_num_wins_using_exact_analysis(parse_input_kerning(in_text)))
+
+    # CROSS-CHECK
+    print("\n================== CROSS-CHECK =================")
+    time_solver("Races solved wrongly", lambda: cross_check())
+    rng = np.random.default_rng()
+    many_race_times = rng.integers(0, MAX_BATCH_RACE_TIME, 10 ** 6)
+    many_records = rng.integers(0, (many_race_times // 2) ** 2 + 1)
+    time_solver("Batch analysis of 10^6 races", lambda: int(get_num_wins_batch(many_race_times, many_records).sum()))
@@ -1,4 +1,13 @@
-import copy
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import chain, count
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from puzzle_input import InputFile, get_buffer, iter_lines, strip_bounds
 
 EXAMPLE1 = """
 32T3K 765
@@ -8,108 +17,246 @@ KTJJT 220
 QQQJA 483
 """
 
+CARDS = "23456789TJQKA"
+JOKER = "J"
+HAND_SIZE = 5
 
-def parse_input(text):
-    games = []
-    bids = []
-    for line in text.strip().split("\n"):
-        cards, bid = line.split(" ")
-        # Make sorting easier
-        cards = cards.replace("T", "a")
-        cards = cards.replace("J", "b")
-        cards = cards.replace("Q", "c")
-        cards = cards.replace("K", "d")
-        cards = cards.replace("A", "e")
-        games.append(cards)
-        bids.append(int(bid))
-
-    return [games, bids]
-
-
-def downvote_jokers(games):
-    joker_voted_cards = []
-    for cards in games:
-        cards = cards.replace("b", "1")
-        joker_voted_cards.append(cards)
-
-    return joker_voted_cards
-
-
-def bin_by_types(games, original_games=None):
-    types = [
-        [], [], [], [], [], [], []
-    ]
-    for i, cards in enumerate(games):
-        if len(set(cards)) == 1:
-            hand_type = 0
-        elif len(set(cards)) == 2:
-            occurrences_of_first_card = sum([c == cards[0] for c in cards])
-            if occurrences_of_first_card == 4 or occurrences_of_first_card == 1:
-                hand_type = 1
-            else:
-                hand_type = 2
-        elif len(set(cards)) == 3:
-            occurrences_of_first_card = sum([c == cards[0] for c in cards])
-            occurrences_of_second_card = sum([c == cards[1] for c in cards])
-            occurrences_of_third_card = sum([c == cards[2] for c in cards])
-            if occurrences_of_first_card == 3 or occurrences_of_second_card == 3 or occurrences_of_third_card == 3:
-                hand_type = 3
-            else:
-                hand_type = 4
-        elif len(set(cards)) == 4:
-            hand_type = 5
-        else:
-            hand_type = 6
+# Ranks from 2 (for "2") to 14 (for "A"), and 1 for jokers, so that all of them fit into 4 bits
+CARD_RANKS = {card: rank for rank, card in enumerate(CARDS, start=2)}
+JOKER_RANK = 1
+RANK_BITS = 4
+
+# The sum of the squared numbers of equal cards identifies the hand type, e.g., 3 ** 2 + 2 ** 2 = 13 for a full house.
+# Types go from 0 (high card) to 6 (five of a kind).
+HAND_TYPES = {5: 0, 7: 1, 9: 2, 11: 3, 13: 4, 17: 5, 25: 6}
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+SPACE = ord(" ")
+ZERO = ord("0")
+
+
+def _get_rank_table() -> np.ndarray:
+    rank_table = np.zeros(256, dtype=np.int64)
+    for card, rank in CARD_RANKS.items():
+        rank_table[ord(card)] = rank
+
+    return rank_table
+
+
+RANK_TABLE = _get_rank_table()
+HAND_TYPE_TABLE = np.array([HAND_TYPES.get(square_sum, -1) for square_sum in range(26)], dtype=np.int64)
+
+
+def read_hands(text) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Character codes of the cards, as an (n, 5) uint8 array, and bids of all hands, parsed for all lines at once.
+    """
+    data = get_buffer(text)
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    start, end = strip_bounds(data)
+    buffer = np.frombuffer(data, dtype=np.uint8, count=end - start, offset=start)
+
+    newlines = np.flatnonzero(buffer == NEWLINE)
+    line_starts = np.concatenate(([0], newlines + 1))
+    line_ends = np.concatenate((newlines, [len(buffer)]))
+    line_ends -= buffer[np.maximum(line_ends - 1, 0)] == CARRIAGE_RETURN
+    bid_lengths = line_ends - line_starts - HAND_SIZE - 1
+    if bid_lengths.min() < 1 or not (buffer[line_starts + HAND_SIZE] == SPACE).all():
+        raise ValueError("Lines have to consist of a hand of five cards, a space, and a bid.")
+    hands = buffer[line_starts[:, None] + np.arange(HAND_SIZE)]
+
+    bids = np.zeros(len(line_starts), dtype=np.int64)
+    for k in range(bid_lengths.max()):
+        has_digit = k < bid_lengths
+        digits = buffer[np.where(has_digit, line_starts + HAND_SIZE + 1 + k, 0)].astype(np.int64) - ZERO
+        if not ((digits[has_digit] >= 0) & (digits[has_digit] <= 9)).all():
+            raise ValueError("Bids have to be non-negative integers.")
+        bids = np.where(has_digit, bids * 10 + digits, bids)
+
+    return hands, bids
+
+
+def get_hand_key(hand: str, jokers: bool = False) -> int:
+    """
+    Integer that orders hands by their strength: the hand type in the highest bits, followed by the ranks of the five
+    cards, 4 bits each. With jokers, the jokers join the largest group of equal cards and rank lowest.
+    """
+    num_jokers = hand.count(JOKER) if jokers else 0
+    counts = [hand.count(card) for card in hand if not (num_jokers and card == JOKER)]
+    largest_count = max(counts, default=0)
+    key = HAND_TYPES[sum(counts) + 2 * largest_count * num_jokers + num_jokers ** 2]
+    for card in hand:
+        key = key << RANK_BITS | (JOKER_RANK if num_jokers and card == JOKER else CARD_RANKS[card])
+
+    return key
+
+
+def get_hand_keys(hands: np.ndarray, jokers: bool = False) -> np.ndarray:
+    """
+    Vectorized get_hand_key for the (n, 5) array of card character codes returned by read_hands.
+    """
+    # One contiguous row per card position is much faster to work on than the columns of hands
+    cards = np.ascontiguousarray(hands.T)
+    ranks = RANK_TABLE[cards]
+    if not ranks.all():
+        raise ValueError(f"Hands have to consist of the cards {CARDS}.")
+    is_joker = cards == ord(JOKER) if jokers else np.zeros(cards.shape, dtype=bool)
+    ranks[is_joker] = JOKER_RANK
+
+    # Number of cards equal to each card, where jokers aren't counted
+    counts = np.zeros(cards.shape, dtype=np.int8)
+    for i in range(HAND_SIZE):
+        for j in range(HAND_SIZE):
+            counts[i] += cards[i] == cards[j]
+    counts[is_joker] = 0
+    num_jokers = np.count_nonzero(is_joker, axis=0)
+    square_sums = counts.sum(axis=0, dtype=np.int64) + 2 * counts.max(axis=0) * num_jokers + num_jokers ** 2
+    keys = HAND_TYPE_TABLE[square_sums]
+    for i in range(HAND_SIZE):
+        keys = keys << RANK_BITS | ranks[i]
 
-        if original_games is not None:
-            cards = original_games[i]
-        types[hand_type].append((i, cards))
+    return keys
 
-    return types
 
+# Keys take up 23 bits, which leaves the lower bits of an int64 for the index of the hand
+INDEX_BITS = 40
 
-def bin_by_types_with_jokers(games):
-    joker_games = []
-    for cards in games:
-        if '1' in cards:
-            used_cards = set(cards)
-            used_cards.remove("1")
-            if not used_cards:  # Only Jokers
-                most_frequent_card = "e"
-            else:
-                most_frequent_card = max(max(used_cards, key=cards.count))
-            cards = cards.replace("1", most_frequent_card)
-        joker_games.append(cards)
 
-    return bin_by_types(joker_games, games)
+def get_ranking(keys: np.ndarray) -> np.ndarray:
+    """
+    Indices of the hands from the weakest to the strongest, where equal hands are ranked by input order. Packing the
+    index into the keys makes them unique, so that a plain sort of the packed keys is stable, and faster than argsort.
+    """
+    if len(keys) >= 1 << INDEX_BITS:
+        raise ValueError(f"At most 2^{INDEX_BITS} hands can be ranked.")
 
+    return np.sort(keys << INDEX_BITS | np.arange(len(keys))) & ((1 << INDEX_BITS) - 1)
 
-def get_sorted_game_ids(bins):
-    sorted_bins = copy.deepcopy(bins)
-    for b in sorted_bins:
-        b.sort(key=lambda x: x[1], reverse=True)
 
-    return reversed([game[0] for sorted_bin in sorted_bins for game in sorted_bin])
+def get_total_winnings(keys: np.ndarray, bids: np.ndarray) -> int:
+    return int(np.arange(1, len(keys) + 1, dtype=np.int64) @ bids[get_ranking(keys)])
 
 
-def get_winnings(sorted_games, bids):
-    winnings_output = []
-    for i, game_id in enumerate(sorted_games):
-        winnings_output.append((i + 1) * bids[game_id])
+# External-memory ranking, for hand files that don't fit into memory: hands are streamed and ranked in runs of at most
+# buffer_size hands, which are written to temporary files and merged back together while adding up the winnings. At
+# most max_fan_in runs are merged at once (as every run takes up a file descriptor and a share of the buffer), so with
+# more runs than that, groups of them are merged into longer runs first.
 
-    return winnings_output
+DEFAULT_BUFFER_SIZE = 1 << 20
+DEFAULT_MAX_FAN_IN = 64
+
+
+def iter_hand_records(text, jokers: bool = False) -> Iterator[Tuple[int, int]]:
+    """
+    Key of each hand, with the hand's index packed into it like in get_ranking, and its bid.
+    """
+    for index, line in enumerate(iter_lines(text)):
+        hand, bid = line.split()
+        yield get_hand_key(hand, jokers) << INDEX_BITS | index, int(bid)
+
+
+def _write_run(records: List[Tuple[int, int]], path: str) -> str:
+    records.sort()
+    with open(path, "wb") as fh:
+        array("q", chain.from_iterable(records)).tofile(fh)
+
+    return path
+
+
+def _iter_run(path: str, block_size: int) -> Iterator[Tuple[int, int]]:
+    # Only block_size records of each run are held in memory at a time
+    with open(path, "rb") as fh:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(fh, 2 * block_size)
+            except EOFError:  # Last block, which keeps the records that were read
+                pass
+            if not block:
+                return
+            values = iter(block)
+            yield from zip(values, values)
+
+
+def _merge_runs(run_paths: List[str], block_size: int) -> Iterator[Tuple[int, int]]:
+    return heapq.merge(*(_iter_run(path, block_size) for path in run_paths))
+
+
+def _write_merged_run(run_paths: List[str], path: str, block_size: int) -> str:
+    with open(path, "wb") as fh:
+        block = array("q")
+        for record in _merge_runs(run_paths, block_size):
+            block.extend(record)
+            if len(block) >= 2 * block_size:
+                block.tofile(fh)
+                block = array("q")
+        block.tofile(fh)
+    for run_path in run_paths:
+        os.remove(run_path)
+
+    return path
+
+
+def get_total_winnings_external(
+        text,
+        jokers: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_fan_in: int = DEFAULT_MAX_FAN_IN,
+        temp_dir: Optional[str] = None
+) -> int:
+    """
+    Same as get_total_winnings(get_hand_keys(*read_hands(text))), but with memory bounded by buffer_size hands.
+    """
+    if buffer_size < 1 or max_fan_in < 2:
+        raise ValueError("The buffer size has to be at least 1, and the maximum fan-in at least 2.")
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        run_ids = count()
+
+        def get_run_path() -> str:
+            return os.path.join(run_dir, f"run{next(run_ids)}.bin")
+
+        run_paths = []
+        records = []
+        for record in iter_hand_records(text, jokers):
+            records.append(record)
+            if len(records) == buffer_size:
+                run_paths.append(_write_run(records, get_run_path()))
+                records = []
+
+        if run_paths:
+            if records:
+                run_paths.append(_write_run(records, get_run_path()))
+                records = []
+            while len(run_paths) > max_fan_in:
+                # One block of every merged run plus one block of the output
+                block_size = max(buffer_size // (max_fan_in + 1), 1)
+                run_paths = [
+                    _write_merged_run(run_paths[i:i + max_fan_in], get_run_path(), block_size)
+                    for i in range(0, len(run_paths), max_fan_in)
+                ]
+            # The merge holds one block of every run, which together take up at most the buffer
+            ranked_records = _merge_runs(run_paths, max(buffer_size // len(run_paths), 1))
+        else:
+            ranked_records = iter(sorted(records))
+
+        total_winnings = 0
+        for rank, (_, bid) in enumerate(ranked_records, start=1):
+            total_winnings += rank * bid
+
+    return total_winnings
 
 
 if __name__ == "__main__":
-    with open("../inputs/input7.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input7.txt")
 
     # PART 1
-    my_games, my_bids = parse_input(in_text)
-    sorted_game_ids = get_sorted_game_ids(bin_by_types(my_games))
-    print(sum(get_winnings(sorted_game_ids, my_bids)))
+    my_hands, my_bids = read_hands(in_text)
+    print(get_total_winnings(get_hand_keys(my_hands), my_bids))
 
     # Part 2
-    my_games = downvote_jokers(my_games)
-    sorted_game_ids = get_sorted_game_ids(bin_by_types_with_jokers(my_games))
-    print(sum(get_winnings(sorted_game_ids, my_bids)))
+    print(get_total_winnings(get_hand_keys(my_hands, jokers=True), my_bids))
+
+    # BOTH PARTS WITH BOUNDED MEMORY
+    print(get_total_winnings_external(in_text), get_total_winnings_external(in_text, jokers=True))
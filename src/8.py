@@ -1,5 +1,7 @@
 import math
 
+from puzzle_input import InputFile, iter_lines
+
 EXAMPLE1 = """
 RL
 
@@ -36,13 +38,15 @@ XXX = (XXX, XXX)
 
 
 def parse_input(text):
-    lines = text.strip().split("\n")
-    instructions_text = lines[0].strip()
+    lines = iter_lines(text)
+    instructions_text = next(lines).strip()
     instructions_text = instructions_text.replace('L', '0').replace('R', '1')
     instructions = list(map(int, list(instructions_text)))
 
     nodes = {}
-    for line in lines[2:]:
+    for line in lines:
+        if not line.strip():
+            continue
         start, end_text = line.split("=")
         start = start.strip()
         left, right = end_text.split(",")
@@ -83,8 +87,7 @@ def navigate_ghost(nodes, instructions):
 
 
 if __name__ == '__main__':
-    with open("../inputs/input8.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input8.txt")
 
     # PART 1
     my_nodes, my_instructions = parse_input(in_text)
@@ -1,4 +1,4 @@
-import numpy
+from puzzle_input import InputFile, iter_lines
 
 EXAMPLE1 = """
 0 3 6 9 12 15
@@ -10,16 +10,16 @@ EXAMPLE1 = """
 
 def parse_input(text):
     return [
-        numpy.array(list(map(lambda s: int(s.strip()), line.strip().split(" ")))) for line in text.strip().split("\n")
+        list(map(lambda s: int(s.strip()), line.strip().split(" "))) for line in iter_lines(text)
     ]
 
 
 def get_differences(series):
     all_diffs = []
-    diffs = numpy.diff(series)
+    diffs = [b - a for a, b in zip(series, series[1:])]
     all_diffs.append(diffs)
-    while not numpy.all(diffs == diffs[0]):
-        diffs = numpy.diff(diffs)
+    while any(d != diffs[0] for d in diffs):
+        diffs = [b - a for a, b in zip(diffs, diffs[1:])]
         all_diffs.append(diffs)
 
     return all_diffs
@@ -37,8 +37,7 @@ def extrapolate(series):
 
 
 if __name__ == "__main__":
-    with open("../inputs/input9.txt", "r") as fh:
-        in_text = fh.read()
+    in_text = InputFile("../inputs/input9.txt")
 
     # PART 1
     print(sum([extrapolate(time_series) for time_series in parse_input(in_text)]))
@@ -0,0 +1,53 @@
+"""
+Stored baselines and JSON reports of the measuring tools (scaling.py and startup.py).
+
+A baseline is a JSON file mapping keys like "<day>" or "<day>.<part>" to a measured value. The tools compare their
+results to it, can write their new values back to it, and report the results to a file or stdout.
+"""
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _baseline_sort_key(item: Tuple[str, float]) -> Tuple[int, ...]:
+    return tuple(int(n) for n in item[0].split("."))
+
+
+def check_baseline(
+        results: List[Dict[str, Any]],
+        path: Optional[str],
+        update: bool,
+        compare: Callable[[List[Dict[str, Any]], Dict[str, float], float], List[Dict[str, Any]]],
+        tolerance: float,
+        get_key: Callable[[Dict[str, Any]], str],
+        value_name: str
+) -> List[Dict[str, Any]]:
+    """
+    Regressions of the results, as found by compare with the baseline at path (if any) and the tolerance. With update,
+    the value_name entries of the results are written to the baseline, which is created if it doesn't exist yet.
+    """
+    baseline = {}
+    if path:
+        try:
+            with open(path, "r") as fh:
+                baseline = json.load(fh)
+        except FileNotFoundError:
+            if not update:
+                raise
+    regressions = compare(results, baseline, tolerance)
+
+    if update:
+        baseline.update({get_key(res): res[value_name] for res in results if value_name in res})
+        with open(path, "w") as fh:
+            json.dump(dict(sorted(baseline.items(), key=_baseline_sort_key)), fh, indent=2)
+            fh.write("\n")
+
+    return regressions
+
+
+def write_report(report: Dict[str, Any], path: Optional[str]) -> None:
+    if path:
+        with open(path, "w") as fh:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+    else:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,272 @@
+import argparse
+import json
+import math
+import numbers
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import instrumentation
+from days import SOLVERS, get_input_path, get_num_parts, load_day
+from puzzle_input import InputFile, Source
+
+# Days that take by far the longest. When running in parallel, they are submitted first, so that they don't end up as
+# stragglers that keep the pool busy long after all the fast days have finished.
+SLOW_DAYS = (22, 23, 25, 12)
+
+
+def to_json_value(value: Any) -> Any:
+    # Many solvers return numpy or sympy scalars, which the json module can't serialize
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        if not math.isfinite(value):  # e.g. -inf returned by find_longest_path (23.py) if there is no path at all
+            return str(value)
+        return int(value) if value.is_integer() else value
+
+    return str(value)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Linear interpolation between the closest ranks, as done by numpy.percentile with its default settings.
+    """
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(sorted_values) - 1)
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (pos - lower)
+
+
+def reset_module_state(module: ModuleType):
+    # Solvers like get_num_combinations (12.py) are memoized. Without clearing their caches, every repetition after the
+    # first one would only measure dictionary lookups.
+    for attr in vars(module).values():
+        if callable(getattr(attr, "cache_clear", None)):
+            attr.cache_clear()
+
+
+def time_solver(
+        module: ModuleType, solver: Callable[[ModuleType, Source], Any], text: Source, repeat: int = 5, warmup: int = 1
+) -> Tuple[List[float], Any]:
+    for _ in range(warmup):
+        reset_module_state(module)
+        solver(module, text)
+
+    times = []
+    res = None
+    for _ in range(repeat):
+        reset_module_state(module)
+        start = time.perf_counter()
+        res = solver(module, text)
+        end = time.perf_counter()
+        times.append(end - start)
+
+    return sorted(times), res
+
+
+def benchmark_part(
+        day: int, part: int, text: Source, repeat: int = 5, warmup: int = 1, profile: bool = False
+) -> Dict[str, Any]:
+    module = load_day(day)
+    solver = SOLVERS[day][part - 1]
+    times, result = time_solver(module, solver, text, repeat, warmup)
+
+    # Tracing allocations slows down the solver considerably, so the peak memory is taken from a separate run
+    reset_module_state(module)
+    instrumentation.start_tracing()
+    try:
+        solver(module, text)
+        peak_memory = instrumentation.get_traced_peak()
+    finally:
+        tracemalloc.stop()
+
+    res = {
+        "day": day,
+        "part": part,
+        "result": to_json_value(result),
+        "repeat": repeat,
+        "warmup": warmup,
+        "min_ms": times[0] * 1000,
+        "median_ms": statistics.median(times) * 1000,
+        "p95_ms": percentile(times, 95) * 1000,
+        "peak_memory_bytes": peak_memory,
+    }
+    if profile:
+        # One more run for the profile of the hot functions, so that it covers exactly one run of the solver
+        reset_module_state(module)
+        instrumentation.reset()
+        instrumentation.start_tracing()
+        try:
+            solver(module, text)
+        finally:
+            tracemalloc.stop()
+        res["profile"] = instrumentation.snapshot()
+
+    return res
+
+
+def benchmark_day(
+        day: int,
+        input_dir: str = "../inputs",
+        repeat: int = 5,
+        warmup: int = 1,
+        use_mmap: bool = False,
+        profile: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    With use_mmap, the solvers get the memory-mapped input file instead of its text, so that the peak memory reflects
+    the parsed data structures only.
+    """
+    input_path = get_input_path(day, input_dir)
+    try:
+        if use_mmap:
+            text = InputFile(input_path)
+        else:
+            with open(input_path, "r") as fh:
+                text = fh.read()
+    except OSError as e:
+        return [{"day": day, "part": part, "error": str(e)} for part in range(1, get_num_parts(day) + 1)]
+
+    results = []
+    try:
+        for part in range(1, get_num_parts(day) + 1):
+            try:
+                results.append(benchmark_part(day, part, text, repeat, warmup, profile))
+            except Exception as e:
+                # A single broken day must not prevent the others from being benchmarked
+                results.append({"day": day, "part": part, "error": f"{type(e).__name__}: {e}"})
+    finally:
+        if use_mmap:
+            text.close()
+
+    return results
+
+
+def schedule_days(days: List[int]) -> List[int]:
+    slow_days = [day for day in SLOW_DAYS if day in days]
+    return slow_days + [day for day in sorted(set(days)) if day not in slow_days]
+
+
+def _benchmark_day_timed(
+        day: int, input_dir: str, repeat: int, warmup: int, use_mmap: bool, profile: bool
+) -> Tuple[int, float, List[Dict[str, Any]]]:
+    start = time.perf_counter()
+    results = benchmark_day(day, input_dir, repeat, warmup, use_mmap, profile)
+    end = time.perf_counter()
+
+    return day, end - start, results
+
+
+def run_benchmarks(
+        days: List[int],
+        input_dir: str = "../inputs",
+        repeat: int = 5,
+        warmup: int = 1,
+        jobs: int = 1,
+        use_mmap: bool = False,
+        profile: bool = False
+) -> Dict[str, Any]:
+    """
+    Benchmark the given days, either one after another (jobs=1) or fanned out across a pool of `jobs` worker
+    processes. The days share no state, so every worker can import and run any of them independently.
+
+    With profile, every result includes the records of the functions decorated with instrumentation.profiled. Profiling
+    is enabled before any day module is imported, so it doesn't work for modules that have been imported already.
+    """
+    if profile:
+        instrumentation.enable()
+    start = time.perf_counter()
+    day_results = {}
+    day_times = {}
+    if jobs == 1:
+        for day in schedule_days(days):
+            _, day_times[day], day_results[day] = _benchmark_day_timed(
+                day, input_dir, repeat, warmup, use_mmap, profile
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(_benchmark_day_timed, day, input_dir, repeat, warmup, use_mmap, profile)
+                for day in schedule_days(days)
+            ]
+            for future in as_completed(futures):
+                day, day_times[day], day_results[day] = future.result()
+    end = time.perf_counter()
+
+    return {
+        "python": sys.version.split()[0],
+        "jobs": jobs,
+        "mmap": use_mmap,
+        "total_s": end - start,
+        "day_s": {str(day): day_times[day] for day in sorted(day_times)},
+        "results": [res for day in sorted(day_results) for res in day_results[day]],
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time part 1 and part 2 of every day and report the results as JSON.")
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=sorted(SOLVERS), help="Days to run (default: all)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Number of timed repetitions per part")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="Number of untimed warm-up runs per part")
+    parser.add_argument("-i", "--input-dir", default="../inputs", help="Directory containing the inputN.txt files")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Number of worker processes to spread the days across (0: one per CPU core, default: 1, i.e., serial)"
+    )
+    parser.add_argument(
+        "--mmap", action="store_true", help="Pass the memory-mapped input files to the solvers instead of their text"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Profile the hot functions in an additional run per part (slows down the timed runs a bit as well)"
+    )
+    parser.add_argument(
+        "--collapsed", help="Write the collapsed stacks of the profiled functions to this file (implies --profile)"
+    )
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    unknown_days = set(args.days) - set(SOLVERS)
+    if unknown_days:
+        parser.error(f"Unknown days: {sorted(unknown_days)}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1.")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative.")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    if args.collapsed:
+        args.profile = True
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    report = run_benchmarks(args.days, args.input_dir, args.repeat, args.warmup, args.jobs, args.mmap, args.profile)
+    if args.collapsed:
+        # One root frame per day and part, e.g. "16.2;16.follow_path 1234"
+        instrumentation.dump_collapsed(args.collapsed, {
+            f"{res['day']}.{res['part']};{stack}": micros
+            for res in report["results"] if "profile" in res
+            for stack, micros in res["profile"]["stacks"].items()
+        })
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
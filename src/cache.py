@@ -0,0 +1,165 @@
+"""
+On-disk cache of solver results.
+
+Entries are addressed by the SHA-256 of the input bytes, a hash of the solver source code, and the part, so a result is
+only reused for the very same input and the very same code. Every entry is a small JSON file, and the least recently
+used entries are evicted once the cache grows beyond its size limit.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+from puzzle_input import InputFile, get_buffer
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "aoc2023-cache")
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def hash_input(source: InputFile) -> str:
+    return hashlib.sha256(get_buffer(source)).hexdigest()
+
+
+def _get_local_source_files(module: ModuleType) -> List[str]:
+    """
+    Source files of the module and of the modules of this repository it imports from (e.g. grid.py), which the
+    solvers' results depend on as well.
+    """
+    files = {module.__file__}
+    for obj in vars(module).values():
+        if isinstance(obj, ModuleType):
+            dependency = obj
+        else:
+            dependency = sys.modules.get(getattr(obj, "__module__", None) or "")
+        file = getattr(dependency, "__file__", None)
+        if file is not None and os.path.dirname(os.path.abspath(file)) == SRC_DIR:
+            files.add(file)
+
+    return sorted(files)
+
+
+def hash_solver_source(module: ModuleType) -> str:
+    # days.py wires the modules' functions together to the solvers of both parts
+    digest = hashlib.sha256()
+    for file in _get_local_source_files(module) + [os.path.join(SRC_DIR, "days.py")]:
+        with open(file, "rb") as fh:
+            digest.update(fh.read())
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # The cache is shared by the handler threads of the solver server (see daemon.py)
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(input_hash: str, source_hash: str, part: int) -> str:
+        return hashlib.sha256(f"{input_hash}:{source_hash}:{part}".encode("ascii")).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._get_path(key)
+        try:
+            with open(path, "r") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):  # Missing, or evicted in the meantime
+            with self._lock:
+                self.misses += 1
+            return None
+        # The modification time doubles as the time of last use for the LRU eviction
+        try:
+            os.utime(path)
+        except OSError:  # Evicted since it was read, which doesn't make the entry read any less valid
+            pass
+        with self._lock:
+            self.hits += 1
+
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        path = self._get_path(key)
+        # Write to a temporary file first, so that readers never see a partially written entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump(entry, fh)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def _list_entries(self) -> List[os.DirEntry]:
+        return [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith(".json")]
+
+    def evict(self):
+        entries = sorted(self._list_entries(), key=lambda entry: entry.stat().st_mtime)
+        total_bytes = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:  # Evicted by another thread or process in the meantime
+                continue
+            total_bytes -= size
+            with self._lock:
+                self.evictions += 1
+
+    def clear(self):
+        for entry in self._list_entries():
+            os.remove(entry.path)
+
+    def disk_stats(self) -> Dict[str, Any]:
+        entries = self._list_entries()
+        return {
+            "cache_dir": self.cache_dir,
+            "entries": len(entries),
+            "size_bytes": sum(entry.stat().st_size for entry in entries),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        # Hits, misses, and evictions are only counted in memory, so they cover the lookups of this process alone
+        lookups = self.hits + self.misses
+        return {
+            **self.disk_stats(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or clear the on-disk cache of solver results.")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory of the cache entries")
+    parser.add_argument("command", choices=("stats", "clear"))
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    cache = ResultCache(args.cache_dir)
+    if args.command == "clear":
+        cache.clear()
+    # A fresh process hasn't looked anything up, so only the contents of the cache directory are of interest
+    print(json.dumps(cache.disk_stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
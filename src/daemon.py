@@ -0,0 +1,253 @@
+"""
+Long-running solver server, so that repeated runs don't pay for interpreter start-up and imports every time.
+
+The server keeps a pool of worker processes with all day modules (and their lazily imported dependencies) loaded, and
+accepts jobs over a Unix domain socket. Requests and responses are JSON objects, one per line:
+
+    {"op": "solve", "day": 5, "part": 1, "input": "/abs/path/to/input5.txt"}
+    {"day": 5, "part": 1, "result": 35, "time_ms": 0.41}
+
+Jobs beyond the configured queue size are rejected right away instead of piling up. Results are looked up in the result
+cache (see cache.py) before a job is handed to a worker, unless the server or the request disables the cache.
+"""
+import argparse
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from benchmark import reset_module_state, to_json_value
+from cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, ResultCache, hash_input, hash_solver_source
+from days import SOLVERS, get_input_path, get_num_parts, load_day
+from puzzle_input import InputFile
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "aoc2023.sock")
+
+# Imported by the solvers on first use only (see startup.py). The workers import them up front, so that no job pays for
+# them.
+LAZY_DEPENDENCIES = ("sympy", "tqdm")
+
+
+def _warm_up():
+    for day in SOLVERS:
+        load_day(day)
+    for name in LAZY_DEPENDENCIES:
+        importlib.import_module(name)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def run_job(day: int, part: int, input_path: str) -> Dict[str, Any]:
+    module = load_day(day)
+    solver = SOLVERS[day][part - 1]
+    with InputFile(input_path) as input_file:
+        reset_module_state(module)
+        start = time.perf_counter()
+        res = solver(module, input_file)
+        end = time.perf_counter()
+
+    return {"day": day, "part": part, "result": to_json_value(res), "time_ms": (end - start) * 1000}
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, workers: int, queue_size: int, cache: Optional[ResultCache] = None):
+        super().__init__(socket_path, JobHandler)
+        self.cache = cache
+        # Hashed once, as the workers keep running the code they imported at start-up even if the sources change
+        self.source_hashes = {day: hash_solver_source(load_day(day)) for day in SOLVERS} if cache is not None else {}
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_up)
+        # Jobs that are either running or waiting for a worker
+        self.job_slots = threading.BoundedSemaphore(queue_size)
+        # Start (and warm up) all workers right away instead of on the first jobs
+        for future in [self.executor.submit(_ping) for _ in range(workers)]:
+            future.result()
+
+    def solve(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            day = int(request["day"])
+            part = int(request.get("part", 1))
+            input_path = request["input"]
+        except (KeyError, TypeError, ValueError) as e:
+            return {"error": f"Invalid request: {type(e).__name__}: {e}"}
+        if day not in SOLVERS or not 1 <= part <= get_num_parts(day):
+            return {"day": day, "part": part, "error": f"Unknown day/part: {day}/{part}"}
+
+        cache_key = None
+        if self.cache is not None and request.get("cache", True):
+            try:
+                with InputFile(input_path) as input_file:
+                    input_hash = hash_input(input_file)
+            except OSError as e:
+                return {"day": day, "part": part, "error": f"{type(e).__name__}: {e}"}
+            cache_key = ResultCache.make_key(input_hash, self.source_hashes[day], part)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+        if not self.job_slots.acquire(blocking=False):
+            return {"day": day, "part": part, "error": "Job queue is full."}
+        try:
+            res = self.executor.submit(run_job, day, part, input_path).result()
+        except Exception as e:
+            return {"day": day, "part": part, "error": f"{type(e).__name__}: {e}"}
+        finally:
+            self.job_slots.release()
+        if cache_key is not None:
+            self.cache.put(cache_key, res)
+
+        return res
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+class JobHandler(socketserver.StreamRequestHandler):
+    server: SolverServer
+
+    def respond(self, request: Any) -> Dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"error": "Invalid request: Requests have to be JSON objects."}
+        op = request.get("op", "solve")
+        if op == "solve":
+            return self.server.solve(request)
+        if op == "ping":
+            return {"ok": True}
+        if op == "stats":
+            return self.server.cache.stats() if self.server.cache is not None else {"error": "No cache."}
+        if op == "shutdown":
+            # shutdown() waits for serve_forever() to return, so it can't be called from the handler thread
+            threading.Thread(target=self.server.shutdown).start()
+            return {"ok": True}
+        return {"error": f"Unknown operation: {op}"}
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {"error": f"Invalid request: {e}"}
+            else:
+                response = self.respond(request)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def serve(
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        workers: int = 1,
+        queue_size: int = 16,
+        cache: Optional[ResultCache] = None
+):
+    if os.path.exists(socket_path):
+        # Left over by a server that didn't shut down cleanly
+        os.remove(socket_path)
+    with SolverServer(socket_path, workers, queue_size, cache) as server:
+        print(f"Serving on {socket_path} with {workers} worker(s)", file=sys.stderr)
+        server.serve_forever()
+
+
+def send_requests(requests: List[Dict[str, Any]], socket_path: str = DEFAULT_SOCKET_PATH) -> List[Dict[str, Any]]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as fh:
+            responses = []
+            for request in requests:
+                fh.write(json.dumps(request).encode("utf-8") + b"\n")
+                fh.flush()
+                responses.append(json.loads(fh.readline()))
+
+    return responses
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Solve puzzles on a server that keeps all day modules loaded.")
+    parser.add_argument("-s", "--socket", default=DEFAULT_SOCKET_PATH, help="Path of the Unix domain socket")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Run the server in the foreground")
+    serve_parser.add_argument("-j", "--workers", type=int, default=1, help="Number of worker processes")
+    serve_parser.add_argument(
+        "-q", "--queue-size", type=int, default=16, help="Maximum number of running and waiting jobs"
+    )
+    serve_parser.add_argument("--no-cache", action="store_true", help="Don't cache any results")
+    serve_parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory of the result cache")
+    serve_parser.add_argument(
+        "--cache-size", type=int, default=DEFAULT_MAX_BYTES, help="Size limit of the result cache in bytes"
+    )
+
+    solve_parser = subparsers.add_parser("solve", help="Submit jobs to a running server")
+    solve_parser.add_argument("-d", "--days", type=int, nargs="+", required=True, help="Days to solve")
+    solve_parser.add_argument("-p", "--parts", type=int, nargs="+", help="Parts to solve (default: all)")
+    solve_parser.add_argument(
+        "-i", "--input-dir", default="../inputs", help="Directory containing the inputN.txt files"
+    )
+    solve_parser.add_argument("--no-cache", action="store_true", help="Bypass the result cache of the server")
+
+    subparsers.add_parser("ping", help="Check whether the server is running")
+    subparsers.add_parser("stats", help="Show the hit/miss statistics of the result cache")
+    subparsers.add_parser("stop", help="Shut down the server")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve" and (args.workers < 1 or args.queue_size < 1):
+        parser.error("--workers and --queue-size must be at least 1.")
+    if args.command == "solve":
+        unknown_days = set(args.days) - set(SOLVERS)
+        if unknown_days:
+            parser.error(f"Unknown days: {sorted(unknown_days)}")
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.command == "serve":
+        cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_size)
+        serve(args.socket, args.workers, args.queue_size, cache)
+        return 0
+
+    if args.command == "solve":
+        requests = [
+            # The server doesn't share our working directory
+            {
+                "op": "solve",
+                "day": day,
+                "part": part,
+                "input": os.path.abspath(get_input_path(day, args.input_dir)),
+                "cache": not args.no_cache,
+            }
+            for day in args.days
+            for part in (args.parts or range(1, get_num_parts(day) + 1))
+            if part <= get_num_parts(day)
+        ]
+    else:
+        requests = [{"op": {"ping": "ping", "stats": "stats", "stop": "shutdown"}[args.command]}]
+
+    try:
+        responses = send_requests(requests, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No server running on {args.socket}", file=sys.stderr)
+        return 1
+    for response in responses:
+        print(json.dumps(response))
+
+    return 1 if any("error" in response for response in responses) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+import importlib
+import math
+from types import ModuleType
+from typing import Any, Callable, Dict, Tuple
+
+INPUT_PATH_TEMPLATE = "{input_dir}/input{day}.txt"
+
+
+def load_day(day: int) -> ModuleType:
+    # The day modules are named after their day number, so they can't be imported with a plain import statement
+    return importlib.import_module(str(day))
+
+
+def _day_2_part_1(m: ModuleType, text: str) -> int:
+    num_cubes_in_bag = {"red": 12, "green": 13, "blue": 14}
+    return int(m.get_possible_games(num_cubes_in_bag, m.get_game_statistics(text)).sum())
+
+
+def _day_4_part_1(m: ModuleType, text: str) -> int:
+    return int(m.get_card_worths(m.get_match_counts(*m.read_cards(text))).sum())
+
+
+def _day_4_part_2(m: ModuleType, text: str) -> int:
+    return sum(m.get_number_of_cards(m.get_match_counts(*m.read_cards(text))))
+
+
+def _day_7(m: ModuleType, text: str, jokers: bool) -> int:
+    hands, bids = m.read_hands(text)
+    return m.get_total_winnings(m.get_hand_keys(hands, jokers), bids)
+
+
+def _day_10_part_1(m: ModuleType, text: str) -> int:
+    return m.get_loop(m.parse_input(text))[0]
+
+
+def _day_10_part_2(m: ModuleType, text: str) -> int:
+    return m.get_num_enclosed_tiles_using_floodfill(m.get_loop(m.parse_input(text))[1])
+
+
+def _day_11(m: ModuleType, text: str, blow_up_factor: int) -> int:
+    observation_array = m.parse_input(text)
+    empty_rows, empty_cols = m.get_empty_space(observation_array)
+    return m.get_sum_of_path_lengths(m.index_galaxies(observation_array, empty_rows, empty_cols, blow_up_factor))
+
+
+def _day_14_part_1(m: ModuleType, text: str) -> int:
+    platform = m.parse_input(text)
+    m.tilt_north(platform)
+    return m.calculate_north_load(platform)
+
+
+def _day_17(m: ModuleType, text: str, steering_condition: str, termination_condition: str) -> int:
+    grid = m.parse_input(text)
+    return m.find_shortest_distance_dijkstra(
+        grid,
+        (0, 0),
+        tuple(x - 1 for x in grid.shape),
+        getattr(m, steering_condition),
+        getattr(m, termination_condition)
+    )
+
+
+def _day_21_part_1(m: ModuleType, text: str) -> int:
+    return m.get_num_reachable_garden_plots_after_n_steps(*m.parse_input(text), 64)
+
+
+def _day_22_part_1(m: ModuleType, text: str) -> int:
+    return m.get_num_disintegratable_blocks(m.stack_blocks(m.parse_input(text)))
+
+
+def _day_22_part_2(m: ModuleType, text: str) -> int:
+    return m.get_num_overall_falling_blocks(m.stack_blocks(m.parse_input(text)))
+
+
+def _day_23(m: ModuleType, text: str, ignore_slopes: bool) -> int:
+    hike_map = m.parse_input(text, ignore_slopes=ignore_slopes)
+    start_position, end_position = m.find_start_and_end_coordinates(hike_map)
+    graph = m.build_map_graph(hike_map, start_position, end_position)
+    return m.find_longest_path(graph, start_position, end_position, set())
+
+
+# One entry per day, holding a callable per puzzle part. Each callable takes the loaded day module and the puzzle input
+# text and returns the puzzle answer, i.e., it does exactly what the __main__ block of the respective day does.
+SOLVERS: Dict[int, Tuple[Callable[[ModuleType, str], Any], ...]] = {
+    1: (
+        lambda m, text: m.get_calibration_number(text),
+        lambda m, text: m.get_corrected_calibration_number(text),
+    ),
+    2: (
+        _day_2_part_1,
+        lambda m, text: m.get_product_sum(m.get_min_cubes(m.get_game_statistics(text))),
+    ),
+    3: (
+        lambda m, text: int(m.get_part_numbers(m.get_schematic_matrix(text)).sum()),
+        lambda m, text: int(m.get_gear_ratios(m.get_schematic_index(m.get_schematic_matrix(text))).sum()),
+    ),
+    4: (_day_4_part_1, _day_4_part_2),
+    5: (
+        lambda m, text: min(m.get_locations(*m.parse_input(text))),
+        lambda m, text: min(x[0] for x in m.get_location_ranges(*m.parse_input(text, seed_ranges=True))),
+    ),
+    6: (
+        lambda m, text: math.prod(m.get_num_wins_using_exact_analysis(r) for r in m.parse_input(text)),
+        lambda m, text: m.get_num_wins_using_exact_analysis(m.parse_input_kerning(text)),
+    ),
+    7: (
+        lambda m, text: _day_7(m, text, False),
+        lambda m, text: _day_7(m, text, True),
+    ),
+    8: (
+        lambda m, text: m.navigate(*m.parse_input(text)),
+        lambda m, text: m.navigate_ghost(*m.parse_input(text)),
+    ),
+    9: (
+        lambda m, text: sum(m.extrapolate(time_series) for time_series in m.parse_input(text)),
+        lambda m, text: sum(m.extrapolate(time_series[::-1]) for time_series in m.parse_input(text)),
+    ),
+    10: (_day_10_part_1, _day_10_part_2),
+    11: (
+        lambda m, text: _day_11(m, text, 2),
+        lambda m, text: _day_11(m, text, 1000000),
+    ),
+    12: (
+        lambda m, text: sum(m.get_num_combinations_all_rows(m.parse_input(text))),
+        lambda m, text: sum(m.get_num_combinations_all_rows(m.parse_input(text, num_copies=5))),
+    ),
+    13: (
+        lambda m, text: sum(map(m.find_reflection_index, m.parse_input(text))),
+        lambda m, text: sum(map(m.find_new_reflection_index, m.parse_input(text))),
+    ),
+    14: (
+        _day_14_part_1,
+        lambda m, text: m.calculate_north_load_after_cycles(m.parse_input(text)),
+    ),
+    15: (
+        lambda m, text: sum(map(m.calculate_hash, m.parse_input(text))),
+        lambda m, text: m.sum_focusing_powers(m.fill_boxes(m.parse_input_part_2(text))),
+    ),
+    16: (
+        lambda m, text: m.get_num_visited_points_starting_top_left(m.parse_input(text)),
+        lambda m, text: m.get_max_num_visited_points(m.parse_input(text)),
+    ),
+    17: (
+        lambda m, text: _day_17(m, text, "can_crucible_run_part1", "can_crucible_stop_part1"),
+        lambda m, text: _day_17(m, text, "can_crucible_run_part2", "can_crucible_stop_part2"),
+    ),
+    18: (
+        lambda m, text: m.get_total_volume(m.parse_input_part1(text)),
+        lambda m, text: m.get_total_volume(m.parse_input_part2(text)),
+    ),
+    19: (
+        lambda m, text: m.run_workflows_and_sum_ratings_of_accepted_parts(*m.parse_input(text)),
+        lambda m, text: m.run_workflow_using_parameter_ranges_and_get_num_accepted_combinations(
+            m.parse_input(text)[0], "in", [[1, 4000] for _ in range(4)]
+        ),
+    ),
+    20: (
+        lambda m, text: m.get_pulse_product(m.parse_input(text), 1000),
+        lambda m, text: m.get_num_button_pushes_to_send_low_signal_to_rx(m.parse_input(text)),
+    ),
+    21: (
+        _day_21_part_1,
+        lambda m, text: m.get_num_reachable_garden_plots_after_26501365_steps_on_infinite_grid(*m.parse_input(text)),
+    ),
+    22: (_day_22_part_1, _day_22_part_2),
+    23: (
+        lambda m, text: _day_23(m, text, False),
+        lambda m, text: _day_23(m, text, True),
+    ),
+    24: (
+        lambda m, text: m.get_num_intersecting_trajectories(m.parse_input(text), 200000000000000, 400000000000000),
+        lambda m, text: m.get_initial_coordinates_of_rock(m.parse_input(text, ignore_z=False)),
+    ),
+    25: (
+        lambda m, text: m.get_three_cut_and_multiply_subgraph_sizes(m.parse_input(text)),
+    ),
+}
+
+
+def get_input_path(day: int, input_dir: str = "../inputs") -> str:
+    return INPUT_PATH_TEMPLATE.format(input_dir=input_dir, day=day)
+
+
+def get_num_parts(day: int) -> int:
+    return len(SOLVERS[day])
+
+
+def solve(day: int, part: int, text: str) -> Any:
+    return SOLVERS[day][part - 1](load_day(day), text)
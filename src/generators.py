@@ -0,0 +1,724 @@
+"""
+Synthetic puzzle inputs of arbitrary size.
+
+Every generator produces a valid input for its day, scaled relative to the size of the original puzzle input: scale=1
+yields roughly as many lines (or grid cells) as the real input, scale=10 ten times as many, and so on. Wherever a solver
+relies on a special structure of the real input, the generator reproduces it. All randomness comes from the passed
+random.Random instance, so the same seed always yields the same input.
+"""
+import argparse
+import math
+import os
+import random
+import string
+from typing import Callable, Dict, List, Optional, Tuple
+
+DIGIT_WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+def _scaled(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * scale))
+
+
+def _scaled_side(base: int, scale: float, minimum: int = 3) -> int:
+    # Grid inputs grow in both dimensions, so the number of cells scales with the square of the side length
+    return max(minimum, round(base * math.sqrt(scale)))
+
+
+def _unique_names(rng: random.Random, num_names: int, min_length: int, alphabet: str = string.ascii_lowercase,
+                  excluded: Tuple[str, ...] = ()) -> List[str]:
+    length = min_length
+    while len(alphabet) ** length < 2 * (num_names + len(excluded)):
+        length += 1
+    names = set()
+    while len(names) < num_names:
+        name = "".join(rng.choice(alphabet) for _ in range(length))
+        if name not in excluded:
+            names.add(name)
+
+    return sorted(names)
+
+
+def _grid_to_text(grid: List[List[str]]) -> str:
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_day_1(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(_scaled(1000, scale)):
+        tokens = []
+        for _ in range(rng.randint(1, 7)):
+            r = rng.random()
+            if r < 0.25:
+                tokens.append(str(rng.randint(1, 9)))
+            elif r < 0.6:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 5))))
+        # Part 1 requires at least one numeric digit per line
+        tokens.insert(rng.randint(0, len(tokens)), str(rng.randint(1, 9)))
+        lines.append("".join(tokens))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_2(scale: float, rng: random.Random) -> str:
+    colors = ("red", "green", "blue")
+    lines = []
+    for game in range(1, _scaled(100, scale) + 1):
+        draws = [rng.sample(colors, rng.randint(1, 3)) for _ in range(rng.randint(1, 6))]
+        # Every color must be drawn at least once per game, otherwise there is no maximum to compare against
+        for color in colors:
+            if not any(color in draw for draw in draws):
+                rng.choice(draws).append(color)
+        draw_texts = [", ".join(f"{rng.randint(1, 20)} {color}" for color in draw) for draw in draws]
+        lines.append(f"Game {game}: " + "; ".join(draw_texts))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_3(scale: float, rng: random.Random) -> str:
+    n = _scaled_side(140, scale)
+    grid = []
+    for _ in range(n):
+        row = []
+        while len(row) < n:
+            r = rng.random()
+            if r < 0.08:
+                number = str(rng.randint(1, 999))[:n - len(row)]
+                row.extend(number)
+                if len(row) < n:
+                    row.append(".")  # Keep numbers from merging
+            elif r < 0.11:
+                row.append(rng.choice("**#+$/@=%-&"))
+            else:
+                row.append(".")
+        grid.append(row)
+
+    return _grid_to_text(grid)
+
+
+def generate_day_4(scale: float, rng: random.Random) -> str:
+    num_cards = _scaled(200, scale)
+    # The number of card copies grows exponentially if a card wins one or more copies on average. Keeping the mean
+    # number of matches below one keeps the copy counts bounded for arbitrarily many cards.
+    match_options = (0, 1, 2, 3, 5, 10)
+    match_weights = (70, 12, 8, 4, 3, 3)
+    width = len(str(num_cards))
+    lines = []
+    for card in range(1, num_cards + 1):
+        num_matches = rng.choices(match_options, match_weights)[0]
+        numbers = rng.sample(range(1, 100), 35 - num_matches)
+        winning = numbers[:10]
+        drawn = winning[:num_matches] + numbers[10:]
+        rng.shuffle(drawn)
+        lines.append(
+            f"Card {card:>{width}}: "
+            + " ".join(f"{x:>2}" for x in winning)
+            + " | "
+            + " ".join(f"{x:>2}" for x in drawn)
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_5(scale: float, rng: random.Random) -> str:
+    domain = 2 ** 32
+    num_seed_ranges = _scaled(10, scale)
+    seeds = []
+    for _ in range(num_seed_ranges):
+        length = rng.randint(1, 2 ** 28)
+        seeds.extend([rng.randrange(domain - length), length])
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+
+    layer_names = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+    num_mappings = _scaled(35, scale)
+    for src_name, tgt_name in zip(layer_names[:-1], layer_names[1:]):
+        # Alternating cut points delimit the (non-overlapping) source ranges and the gaps in between
+        cuts = sorted(rng.sample(range(domain), 2 * num_mappings))
+        src_ranges = [(cuts[i], cuts[i + 1] - cuts[i]) for i in range(0, len(cuts), 2)]
+        # Pack the target ranges back to back in random order, so that every layer stays a one-to-one mapping
+        rng.shuffle(src_ranges)
+        tgt_start = rng.randrange(domain - sum(length for _, length in src_ranges) + 1)
+        lines = [f"{src_name}-to-{tgt_name} map:"]
+        for src_start, length in src_ranges:
+            lines.append(f"{tgt_start} {src_start} {length}")
+            tgt_start += length
+        blocks.append("\n".join(lines))
+
+    return "\n\n".join(blocks) + "\n"
+
+
+# The kerned race of part 2 joins all numbers of a line into one, which int() only parses up to 4300 digits (CPython's
+# default limit). So day 6 inputs keep the four races of the real input and grow their number of digits instead, which
+# limits the scale to where the kerned record still fits.
+DAY_6_NUM_RACES = 4
+MAX_DAY_6_SCALE = 256
+
+
+def generate_day_6(scale: float, rng: random.Random) -> str:
+    if scale > MAX_DAY_6_SCALE:
+        raise ValueError(f"Day 6 inputs can't be scaled beyond {MAX_DAY_6_SCALE}x.")
+    num_digits = _scaled(2, scale)
+    # Race times of num_digits digits starting with 7 or more, and records of one digit less than their squares: Every
+    # race can be won, and so can the kerned race, since its record has fewer digits than its squared race time.
+    race_times = [rng.randint(7 * 10 ** (num_digits - 1), 10 ** num_digits - 1) for _ in range(DAY_6_NUM_RACES)]
+    record_distances = [
+        rng.randint(10 ** (2 * num_digits - 2), 10 ** (2 * num_digits - 1) - 1) for _ in range(DAY_6_NUM_RACES)
+    ]
+    width = 2 * num_digits
+
+    return (
+        "Time:     " + " ".join(f"{t:>{width}}" for t in race_times) + "\n"
+        + "Distance: " + " ".join(f"{d:>{width}}" for d in record_distances) + "\n"
+    )
+
+
+def generate_day_7(scale: float, rng: random.Random) -> str:
+    num_hands = _scaled(1000, scale)
+    card_labels = "23456789TJQKA"
+    # Duplicate hands tie, which makes the ranking ambiguous. Avoid them as long as there are enough distinct hands.
+    avoid_duplicates = num_hands <= len(card_labels) ** 5 // 2
+    seen = set()
+    lines = []
+    while len(lines) < num_hands:
+        hand = "".join(rng.choice(card_labels) for _ in range(5))
+        if avoid_duplicates:
+            if hand in seen:
+                continue
+            seen.add(hand)
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    for d in range(2, math.isqrt(n) + 1):
+        if n % d == 0:
+            return False
+    return True
+
+
+def _primes_from(start: int, count: int) -> List[int]:
+    primes = []
+    n = start
+    while len(primes) < count:
+        if _is_prime(n):
+            primes.append(n)
+        n += 1
+
+    return primes
+
+
+def generate_day_8(scale: float, rng: random.Random) -> str:
+    """
+    Like the real input, every ghost runs through its own cycle, which contains exactly one node ending on Z, and the
+    distance from the starting node to that Z node equals the cycle length. The cycle lengths are distinct primes, so
+    the answer to part 2 is their product. Both children of each cycle node coincide, so the cycles are followed
+    independently of the instructions.
+    """
+    num_ghosts = 6
+    cycle_lengths = _primes_from(_scaled(125, scale, minimum=2), num_ghosts)
+    rng.shuffle(cycle_lengths)
+
+    # Names of inner nodes must neither end on A nor on Z
+    inner_alphabet = string.ascii_uppercase[1:-1]
+    inner_names = iter(_unique_names(rng, sum(cycle_lengths), 3, alphabet=inner_alphabet))
+    stems = ["AA"] + _unique_names(rng, num_ghosts - 1, 2, alphabet=inner_alphabet)
+
+    nodes = []
+    for stem, cycle_length in zip(stems, cycle_lengths):
+        cycle = [next(inner_names) for _ in range(cycle_length - 1)]
+        start, end = stem + "A", ("ZZ" if stem == "AA" else stem) + "Z"
+        nodes.append((start, cycle[0], cycle[0]))
+        for a, b in zip(cycle, cycle[1:] + [end]):
+            nodes.append((a, b, b))
+        nodes.append((end, cycle[0], cycle[0]))
+    rng.shuffle(nodes)
+
+    instructions = "".join(rng.choice("LR") for _ in range(_scaled(281, scale)))
+
+    return instructions + "\n\n" + "\n".join(f"{a} = ({b}, {c})" for a, b, c in nodes) + "\n"
+
+
+def generate_day_9(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(_scaled(200, scale)):
+        degree = rng.randint(0, 6)
+        coefficients = [rng.randint(-6, 6) for _ in range(degree + 1)]
+        shift = rng.randint(0, 10)
+        values = [sum(a * math.comb(x + shift, k) for k, a in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_10(scale: float, rng: random.Random) -> str:
+    """
+    The loop encloses a skyline-like region: It runs along the bottom row b from left to right, climbs up the right
+    edge, and then walks back to the left, visiting every column exactly once at a random height. All other tiles are
+    filled with junk pipes.
+    """
+    n = _scaled_side(140, scale, minimum=6)
+    b, w = n - 2, n - 2
+    tops = [rng.randint(1, b - 1) for _ in range(n)]
+
+    path = [(b, j) for j in range(1, w + 1)]
+    path.extend((i, w) for i in range(b - 1, tops[w] - 1, -1))
+    i = tops[w]
+    for j in range(w - 1, 0, -1):
+        path.append((i, j))
+        target = tops[j] if j > 1 else b
+        step = 1 if target > i else -1
+        for i in range(i + step, target + step, step):
+            path.append((i, j))
+        i = target
+    path.pop()  # The walk ends where it started
+
+    grid = [[rng.choice("||--LJ7F......") for _ in range(n)] for _ in range(n)]
+    pipes = {
+        frozenset("ud"): "|", frozenset("lr"): "-", frozenset("ur"): "L",
+        frozenset("ul"): "J", frozenset("dl"): "7", frozenset("dr"): "F",
+    }
+
+    def direction(frm, to):
+        if to[0] < frm[0]:
+            return "u"
+        if to[0] > frm[0]:
+            return "d"
+        return "l" if to[1] < frm[1] else "r"
+
+    for k, (i, j) in enumerate(path):
+        prev_tile, next_tile = path[k - 1], path[(k + 1) % len(path)]
+        grid[i][j] = pipes[frozenset((direction((i, j), prev_tile), direction((i, j), next_tile)))]
+    grid[b][1] = "S"
+
+    return _grid_to_text(grid)
+
+
+def generate_day_11(scale: float, rng: random.Random) -> str:
+    n = _scaled_side(140, scale)
+    empty_rows = {i for i in range(n) if rng.random() < 0.05}
+    empty_cols = {j for j in range(n) if rng.random() < 0.05}
+    grid = [
+        [
+            "#" if i not in empty_rows and j not in empty_cols and rng.random() < 0.025 else "."
+            for j in range(n)
+        ]
+        for i in range(n)
+    ]
+
+    return _grid_to_text(grid)
+
+
+def generate_day_12(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(_scaled(1000, scale)):
+        groups = [rng.randint(1, 4) for _ in range(rng.randint(1, 5))]
+        length = sum(groups) + len(groups) - 1 + rng.randint(0, 6)
+        # Distribute the spare operational springs randomly around and between the groups
+        gaps = [0] + [1] * (len(groups) - 1) + [0]
+        for _ in range(length - sum(groups) - sum(gaps)):
+            gaps[rng.randrange(len(gaps))] += 1
+        springs = "".join("." * gap + "#" * group for gap, group in zip(gaps, groups)) + "." * gaps[-1]
+        springs = "".join("?" if rng.random() < 0.5 else c for c in springs)
+        lines.append(f"{springs} {','.join(map(str, groups))}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _num_row_reflection_differences(rows: List[str], i: int) -> int:
+    num_differences = 0
+    for n in range(min(i + 1, len(rows) - i - 1)):
+        num_differences += sum(a != b for a, b in zip(rows[i - n], rows[i + 1 + n]))
+
+    return num_differences
+
+
+def _transpose(rows: List[str]) -> List[str]:
+    return ["".join(col) for col in zip(*rows)]
+
+
+def _generate_day_13_pattern(rng: random.Random) -> List[str]:
+    """
+    Build a pattern with a perfect column reflection (part 1) and a row reflection that is off by exactly one tile (part
+    2). The smudged tile lies in a column outside the mirrored part of the column reflection, so it doesn't break the
+    latter. Patterns with accidental additional reflections are rejected.
+    """
+    while True:
+        h, w = rng.randint(5, 17), rng.randint(5, 17)
+        col_axis = rng.randint(0, w - 2)
+        row_axis = rng.randint(0, h - 2)
+        num_mirrored_cols = min(col_axis + 1, w - col_axis - 1)
+        num_mirrored_rows = min(row_axis + 1, h - row_axis - 1)
+        free_cols = [
+            j for j in range(w) if not col_axis - num_mirrored_cols < j <= col_axis + num_mirrored_cols
+        ]
+        if not free_cols:
+            continue
+
+        grid = [[rng.choice("#.") for _ in range(w)] for _ in range(h)]
+        for row in grid:
+            for n in range(num_mirrored_cols):
+                row[col_axis + 1 + n] = row[col_axis - n]
+        for n in range(num_mirrored_rows):
+            grid[row_axis + 1 + n] = grid[row_axis - n].copy()
+        i = rng.randint(row_axis - num_mirrored_rows + 1, row_axis + num_mirrored_rows)
+        j = rng.choice(free_cols)
+        grid[i][j] = "#" if grid[i][j] == "." else "."
+
+        rows = ["".join(row) for row in grid]
+        cols = _transpose(rows)
+        row_differences = [_num_row_reflection_differences(rows, i) for i in range(h - 1)]
+        col_differences = [_num_row_reflection_differences(cols, j) for j in range(w - 1)]
+        if (
+                col_differences[col_axis] == 0 and row_differences[row_axis] == 1 and
+                sum(d <= 1 for d in row_differences + col_differences) == 2
+        ):
+            return _transpose(rows) if rng.random() < 0.5 else rows
+
+
+def generate_day_13(scale: float, rng: random.Random) -> str:
+    patterns = ["\n".join(_generate_day_13_pattern(rng)) for _ in range(_scaled(100, scale))]
+
+    return "\n\n".join(patterns) + "\n"
+
+
+def generate_day_14(scale: float, rng: random.Random) -> str:
+    n = _scaled_side(100, scale)
+    grid = [rng.choices("O#.", (20, 8, 72), k=n) for _ in range(n)]
+
+    return _grid_to_text(grid)
+
+
+def generate_day_15(scale: float, rng: random.Random) -> str:
+    num_steps = _scaled(4000, scale)
+    labels = _unique_names(rng, _scaled(500, scale), 2)
+    steps = []
+    for _ in range(num_steps):
+        label = rng.choice(labels)
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+
+    return ",".join(steps) + "\n"
+
+
+def generate_day_16(scale: float, rng: random.Random) -> str:
+    n = _scaled_side(110, scale)
+    grid = [rng.choices("./\\|-", (90, 3, 3, 2, 2), k=n) for _ in range(n)]
+
+    return _grid_to_text(grid)
+
+
+def generate_day_17(scale: float, rng: random.Random) -> str:
+    n = _scaled_side(141, scale)
+    grid = [[str(rng.randint(1, 9)) for _ in range(n)] for _ in range(n)]
+
+    return _grid_to_text(grid)
+
+
+def _skyline_dig_plan(rng: random.Random, num_columns: int, max_width: int, max_height_change: int) -> List[
+    Tuple[str, int]
+]:
+    """
+    Clockwise outline of a skyline: up the left edge, along the (stepped) roof to the right, down the right edge and
+    back along the ground.
+    """
+    heights = [rng.randint(1, max_height_change)]
+    for _ in range(num_columns - 1):
+        change = rng.randint(1, max_height_change) * rng.choice((-1, 1))
+        if heights[-1] + change < 1:
+            change = -change
+        heights.append(heights[-1] + change)
+    widths = [rng.randint(1, max_width) for _ in range(num_columns)]
+
+    plan = [("U", heights[0]), ("R", widths[0])]
+    for k in range(1, num_columns):
+        change = heights[k] - heights[k - 1]
+        plan.append(("U" if change > 0 else "D", abs(change)))
+        plan.append(("R", widths[k]))
+    plan.append(("D", heights[-1]))
+    plan.append(("L", sum(widths)))
+
+    return plan
+
+
+def generate_day_18(scale: float, rng: random.Random) -> str:
+    # Part 1 and part 2 read two different dig plans from each line, so both outlines must have the same length
+    num_columns = _scaled(175, scale)
+    plan_1 = _skyline_dig_plan(rng, num_columns, 6, 6)
+    plan_2 = _skyline_dig_plan(rng, num_columns, 100000, 500000)
+    hex_directions = {"R": 0, "D": 1, "L": 2, "U": 3}
+    lines = [
+        f"{d1} {n1} (#{n2:05x}{hex_directions[d2]})" for (d1, n1), (d2, n2) in zip(plan_1, plan_2)
+    ]
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_19(scale: float, rng: random.Random) -> str:
+    num_workflows = _scaled(550, scale)
+    names = iter(_unique_names(rng, num_workflows, 2, excluded=("in",)))
+    workflows = []
+    # Breadth-first expansion keeps the workflow tree shallow (and free of cycles), as in the real input
+    pending = ["in"]
+    num_created = 1
+    while pending:
+        name = pending.pop(0)
+        targets = []
+        for _ in range(rng.randint(2, 4)):
+            if num_created < num_workflows and rng.random() < 0.8:
+                target = next(names)
+                pending.append(target)
+                num_created += 1
+            else:
+                target = rng.choice("AR")
+            targets.append(target)
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(2, 3999)}:{target}" for target in targets[:-1]
+        ]
+        workflows.append(f"{name}{{{','.join(rules + targets[-1:])}}}")
+    rng.shuffle(workflows)
+
+    parts = [
+        "{" + ",".join(f"{p}={rng.randint(1, 4000)}" for p in "xmas") + "}" for _ in range(_scaled(200, scale))
+    ]
+
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
+
+
+def generate_day_20(scale: float, rng: random.Random) -> str:
+    """
+    Like the real input, the broadcaster feeds a number of independent binary counters built from a chain of flip-flops
+    and a conjunction hub. Each hub resets its counter as soon as it reaches a distinct prime and then pulses an
+    inverter. All inverters feed the single conjunction that is connected to rx.
+    """
+    num_counters = _scaled(4, scale)
+    num_bits = 12
+    periods = _primes_from(2 ** (num_bits - 1), num_counters)
+    while periods[-1] >= 2 ** num_bits:
+        num_bits += 1
+        periods = _primes_from(2 ** (num_bits - 1), num_counters)
+    rng.shuffle(periods)
+
+    names = iter(_unique_names(rng, num_counters * (num_bits + 2) + 1, 2, excluded=("rx",)))
+    final = next(names)
+    lines = []
+    chain_starts = []
+    for period in periods:
+        flip_flops = [next(names) for _ in range(num_bits)]
+        hub, inverter = next(names), next(names)
+        chain_starts.append(flip_flops[0])
+        hub_targets = [inverter, flip_flops[0]]
+        for bit, flip_flop in enumerate(flip_flops):
+            targets = flip_flops[bit + 1:bit + 2]
+            if period >> bit & 1:
+                targets.append(hub)
+            elif bit > 0:
+                hub_targets.append(flip_flop)
+            rng.shuffle(targets)
+            lines.append(f"%{flip_flop} -> {', '.join(targets)}")
+        lines.append(f"&{hub} -> {', '.join(hub_targets)}")
+        lines.append(f"&{inverter} -> {final}")
+    lines.append(f"&{final} -> rx")
+    lines.append(f"broadcaster -> {', '.join(chain_starts)}")
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_21(scale: float, rng: random.Random) -> str:
+    # Part 2 relies on the start being in the center and on its row, its column and the border being free of rocks
+    n = _scaled_side(131, scale) | 1
+    center = n // 2
+    grid = [
+        [
+            "#" if 0 < i < n - 1 and 0 < j < n - 1 and i != center and j != center and rng.random() < 0.12 else "."
+            for j in range(n)
+        ]
+        for i in range(n)
+    ]
+    grid[center][center] = "S"
+
+    return _grid_to_text(grid)
+
+
+def generate_day_22(scale: float, rng: random.Random) -> str:
+    footprint = 10
+    z = 0
+    lines = []
+    for _ in range(_scaled(1250, scale)):
+        length = rng.randint(1, 5)
+        axis = rng.randrange(3)
+        start = [rng.randrange(footprint), rng.randrange(footprint), 0]
+        if axis < 2:
+            start[axis] = rng.randint(0, footprint - length)
+        # Every brick gets its own z interval, so bricks never intersect in their initial positions
+        z += rng.randint(1, 3)
+        start[2] = z
+        end = start.copy()
+        end[axis] += length - 1
+        z = end[2]
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_23(scale: float, rng: random.Random) -> str:
+    """
+    Like the real input, the trails connect a 6x6 lattice of junctions. Each junction leads right and down to its
+    neighbors, with slopes next to every junction that only allow walking right or down. The scale controls the length
+    of the (bent) trails between the junctions, so the junction graph keeps the size of the real one.
+    """
+    k = 6
+    spacing = _scaled_side(22, scale, minimum=8)
+    # Trails around neighboring junctions must stay at least one tile apart
+    jitter = (spacing // 2 - 2) // 2
+    offset = spacing // 2 + jitter + 1
+    n = 2 * offset + (k - 1) * spacing + 1
+    junctions = [
+        [
+            (offset + a * spacing + rng.randint(-jitter, jitter), offset + b * spacing + rng.randint(-jitter, jitter))
+            for b in range(k)
+        ]
+        for a in range(k)
+    ]
+    grid = [["#"] * n for _ in range(n)]
+
+    def dig(trail: List[Tuple[int, int]], slope: Optional[str]):
+        for i, j in trail:
+            grid[i][j] = "."
+        if slope is not None:
+            for i, j in (trail[1], trail[-2]):
+                grid[i][j] = slope
+
+    def trail_between(frm: Tuple[int, int], to: Tuple[int, int], horizontal: bool) -> List[Tuple[int, int]]:
+        (i1, j1), (i2, j2) = frm, to
+        trail = []
+        if horizontal:
+            mid = (j1 + j2) // 2
+            trail.extend((i1, j) for j in range(j1, mid))
+            step = 1 if i2 >= i1 else -1
+            trail.extend((i, mid) for i in range(i1, i2 + step, step))
+            trail.extend((i2, j) for j in range(mid + 1, j2 + 1))
+        else:
+            mid = (i1 + i2) // 2
+            trail.extend((i, j1) for i in range(i1, mid))
+            step = 1 if j2 >= j1 else -1
+            trail.extend((mid, j) for j in range(j1, j2 + step, step))
+            trail.extend((i, j2) for i in range(mid + 1, i2 + 1))
+        return trail
+
+    for a in range(k):
+        for b in range(k):
+            if b + 1 < k:
+                dig(trail_between(junctions[a][b], junctions[a][b + 1], True), ">")
+            if a + 1 < k:
+                dig(trail_between(junctions[a][b], junctions[a + 1][b], False), "v")
+    start_i, start_j = junctions[0][0]
+    dig([(i, start_j) for i in range(start_i + 1)], None)
+    end_i, end_j = junctions[-1][-1]
+    dig([(i, end_j) for i in range(end_i, n)], None)
+
+    return _grid_to_text(grid)
+
+
+def generate_day_24(scale: float, rng: random.Random) -> str:
+    # All hailstones lie on the trajectory of one rock, so that part 2 has an integer solution
+    rock_position = [rng.randint(250000000000000, 350000000000000) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    collision_times = rng.sample(range(10 ** 10, 2 * 10 ** 11), _scaled(300, scale))
+    lines = []
+    for t in collision_times:
+        velocity = [rng.choice([v for v in range(-300, 301) if v not in (0, rv)]) for rv in rock_velocity]
+        position = [p + (rv - v) * t for p, rv, v in zip(rock_position, rock_velocity, velocity)]
+        lines.append(", ".join(map(str, position)) + " @ " + ", ".join(map(str, velocity)))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_25(scale: float, rng: random.Random) -> str:
+    """
+    Two well-connected components joined by exactly three wires. Every node is linked to at least four others within its
+    component, so the three joining wires form the only three-cut.
+    """
+    num_nodes = _scaled(1500, scale, minimum=12)
+    names = _unique_names(rng, num_nodes, 3)
+    rng.shuffle(names)
+    split = int(num_nodes * rng.uniform(0.4, 0.6))
+
+    edges = []
+    for component in (names[:split], names[split:]):
+        for i in range(1, len(component)):
+            neighbors = range(i) if i <= 5 else rng.sample(range(i), 4)
+            edges.extend((component[i], component[j]) for j in neighbors)
+    for a, b in zip(rng.sample(names[:split], 3), rng.sample(names[split:], 3)):
+        edges.append((a, b))
+
+    connections = {}
+    for a, b in edges:
+        if rng.random() < 0.5:
+            a, b = b, a
+        connections.setdefault(a, []).append(b)
+    lines = [f"{key}: {' '.join(vals)}" for key, vals in connections.items()]
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS: Dict[int, Callable[[float, random.Random], str]] = {
+    day: globals()[f"generate_day_{day}"] for day in range(1, 26)
+}
+
+# Days whose inputs can't grow beyond a certain scale
+MAX_SCALES: Dict[int, float] = {6: MAX_DAY_6_SCALE}
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> str:
+    # Seeding with a string is deterministic across interpreter runs (unlike hash-based seeds)
+    return GENERATORS[day](scale, random.Random(f"{day}:{seed}"))
+
+
+def get_generated_input_dir(output_dir: str, scale: float) -> str:
+    return os.path.join(output_dir, f"x{scale:g}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Write synthetic puzzle inputs of the given sizes.")
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=sorted(GENERATORS), help="Days (default: all)")
+    parser.add_argument(
+        "-s", "--scales", type=float, nargs="+", default=[1.0], help="Sizes relative to the real puzzle input"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "-o", "--output-dir", default="../inputs/generated",
+        help="Inputs are written to <output-dir>/x<scale>/input<day>.txt, so that benchmark.py can read them directly"
+    )
+    args = parser.parse_args(argv)
+
+    unknown_days = set(args.days) - set(GENERATORS)
+    if unknown_days:
+        parser.error(f"Unknown days: {sorted(unknown_days)}")
+    if any(scale <= 0 for scale in args.scales):
+        parser.error("Scales must be positive.")
+    for day in args.days:
+        if day in MAX_SCALES and max(args.scales) > MAX_SCALES[day]:
+            parser.error(f"Day {day} inputs can't be scaled beyond {MAX_SCALES[day]:g}x.")
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    for scale in args.scales:
+        input_dir = get_generated_input_dir(args.output_dir, scale)
+        os.makedirs(input_dir, exist_ok=True)
+        for day in args.days:
+            with open(os.path.join(input_dir, f"input{day}.txt"), "w") as fh:
+                fh.write(generate(day, scale, args.seed))
+
+
+if __name__ == "__main__":
+    main()
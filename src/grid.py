@@ -0,0 +1,76 @@
+"""
+Loading of character grids (days 3, 10, 11, 13, 14, 16, 21, and 23) without any per-cell Python work.
+"""
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from puzzle_input import InputFile, get_buffer, strip_bounds
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+GridSource = Union[str, bytes, bytearray, InputFile]
+
+
+def load_grid(text: GridSource, table: Optional[Dict[str, int]] = None, dtype: np.dtype = np.uint8) -> np.ndarray:
+    """
+    Interpret the text as a 2D grid of characters, one row per line. The file buffer is reshaped into rows including
+    their line breaks, and the line breaks are then sliced off, so that the returned uint8 array of character codes is a
+    (read-only) view of the input bytes, or of the memory-mapped file in case of an InputFile. If a translation table is
+    given, the character codes are mapped to the codes of the table instead, which requires one copy.
+    """
+    data = get_buffer(text)
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    start, end = strip_bounds(data)
+    if start == end:
+        raise ValueError("Grid is empty.")
+
+    width = data.find(b"\n", start, end)
+    width = end - start if width == -1 else width - start
+    separator_length = 1
+    if width > 0 and data[start + width - 1] == CARRIAGE_RETURN:
+        width -= 1
+        separator_length = 2
+    stride = width + separator_length
+    if (end - start + separator_length) % stride != 0:
+        raise ValueError("Grid rows have unequal lengths.")
+
+    separator = b"\r\n"[-separator_length:]
+    if end + separator_length <= len(data):
+        # Include the line break after the last row, so that all rows (with their line breaks) have the same stride
+        buffer = np.frombuffer(data, dtype=np.uint8, count=end - start + separator_length, offset=start)
+    else:
+        buffer = np.frombuffer(bytes(data[start:end]) + separator, dtype=np.uint8)
+    rows = buffer.reshape(-1, stride)
+    if not (rows[:, width:] == np.frombuffer(separator, dtype=np.uint8)).all():
+        raise ValueError("Grid rows have unequal lengths.")
+    grid = rows[:, :width]
+
+    if table is not None:
+        grid = translate_grid(grid, table, dtype)
+
+    return grid
+
+
+def translate_grid(grid: np.ndarray, table: Dict[str, int], dtype: np.dtype = np.uint8) -> np.ndarray:
+    """
+    Map a grid of character codes to the values of the table, e.g. {".": 0, "O": 1, "#": 2}, using a lookup table over
+    all 256 byte values. Characters not contained in the table raise a ValueError.
+    """
+    lookup = np.zeros(256, dtype=dtype)
+    valid = np.zeros(256, dtype=bool)
+    for char, code in table.items():
+        lookup[ord(char)] = code
+        valid[ord(char)] = True
+    if not valid[grid].all():
+        unexpected = set(np.unique(grid[~valid[grid]]).tolist())
+        raise ValueError(f"Unexpected characters in grid: {''.join(sorted(map(chr, unexpected)))}")
+
+    return lookup[grid]
+
+
+def read_grid(path: str, table: Optional[Dict[str, int]] = None, dtype: np.dtype = np.uint8) -> np.ndarray:
+    # The grid is a view of the mapped file, so the mapping is only closed once the last reference to it is gone
+    return load_grid(InputFile(path), table, dtype)
@@ -0,0 +1,174 @@
+"""
+Opt-in profiling of hot functions.
+
+Functions decorated with @profiled record their number of calls, cumulative time (including callees), self time
+(excluding other profiled callees), and their peak memory (while tracemalloc is tracing). Profiling has to be
+switched on before the decorated modules are imported, either with enable() or by setting the environment variable
+AOC_PROFILE=1. Otherwise, @profiled returns the function unchanged, so that it costs nothing.
+
+The records can be dumped as JSON or as collapsed stacks ("outer;inner <microseconds>" per line), which flame graph
+tools like flamegraph.pl or speedscope read directly.
+"""
+import functools
+import json
+import os
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+ENV_VAR = "AOC_PROFILE"
+
+_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+class _Record:
+    __slots__ = ("calls", "total_s", "self_s", "peak_alloc_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_s = 0.0
+        self.self_s = 0.0
+        # Largest peak of the traced memory above its level at the start of a call
+        self.peak_alloc_bytes = 0
+
+
+_records: Dict[str, _Record] = defaultdict(_Record)
+# Self time in seconds per stack of profiled functions
+_stacks: Dict[str, float] = defaultdict(float)
+# Frames of the profiled functions currently running: [name, stack, start time, time spent in profiled callees, peak of
+# the traced memory during the call so far]
+_frames: List[list] = []
+# Number of running calls per function, so that recursive calls don't count towards the cumulative time twice
+_active: Dict[str, int] = defaultdict(int)
+# Peak of the traced memory before the last reset of the peak by a profiled function (see get_traced_peak)
+_peak_before_reset = 0
+
+
+def enable():
+    """
+    Switch on profiling for all modules imported from now on, including those imported by worker processes.
+    """
+    global _enabled
+    _enabled = True
+    os.environ[ENV_VAR] = "1"
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    _records.clear()
+    _stacks.clear()
+
+
+def start_tracing():
+    """
+    Start tracemalloc, and the peak returned by get_traced_peak with it.
+    """
+    global _peak_before_reset
+    _peak_before_reset = 0
+    tracemalloc.start()
+
+
+def get_traced_peak() -> int:
+    """
+    Peak of the traced memory since start_tracing. Profiled functions reset the peak of tracemalloc to measure their
+    own, so tracemalloc.get_traced_memory() alone would only return the peak since the last of these resets.
+    """
+    return max(_peak_before_reset, tracemalloc.get_traced_memory()[1])
+
+
+def _update_peak(peak: int):
+    # The peak counts for the calling profiled function, or for the whole traced run outside of them
+    global _peak_before_reset
+    if _frames:
+        _frames[-1][4] = max(_frames[-1][4], peak)
+    else:
+        _peak_before_reset = max(_peak_before_reset, peak)
+
+
+def profiled(func: Optional[Callable] = None, *, name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording calls, time, and allocations of the function under the given name (default: module.qualname).
+    Memoized functions should be decorated on top of @cache, so that cache hits are counted as calls as well.
+    """
+    if func is None:
+        return functools.partial(profiled, name=name)
+    if not _enabled:
+        return func
+
+    label = name or f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _frames:
+            parent = _frames[-1]
+            # Direct recursion is folded into a single frame, as it would blow up the number of stacks otherwise
+            stack = parent[1] if parent[0] == label else f"{parent[1]};{label}"
+        else:
+            stack = label
+        frame = [label, stack, 0.0, 0.0, 0]
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            memory_before, peak = tracemalloc.get_traced_memory()
+            _update_peak(peak)
+            tracemalloc.reset_peak()
+        _frames.append(frame)
+        _active[label] += 1
+        frame[2] = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - frame[2]
+            _frames.pop()
+            _active[label] -= 1
+            record = _records[label]
+            record.calls += 1
+            record.self_s += elapsed - frame[3]
+            _stacks[stack] += elapsed - frame[3]
+            if tracing:
+                frame[4] = max(frame[4], tracemalloc.get_traced_memory()[1])
+            if not _active[label]:
+                record.total_s += elapsed
+                if tracing:
+                    record.peak_alloc_bytes = max(record.peak_alloc_bytes, frame[4] - memory_before)
+            if _frames:
+                _frames[-1][3] += elapsed
+            if tracing:
+                _update_peak(frame[4])
+
+    # Keep the cache of memoized functions accessible, e.g. for benchmark.reset_module_state
+    for attr in ("cache_clear", "cache_info"):
+        if hasattr(func, attr):
+            setattr(wrapper, attr, getattr(func, attr))
+
+    return wrapper
+
+
+def snapshot() -> Dict[str, Any]:
+    return {
+        "functions": {
+            label: {
+                "calls": record.calls,
+                "total_ms": record.total_s * 1000,
+                "self_ms": record.self_s * 1000,
+                "peak_alloc_bytes": record.peak_alloc_bytes,
+            }
+            for label, record in sorted(_records.items(), key=lambda item: item[1].total_s, reverse=True)
+        },
+        "stacks": {stack: round(self_s * 1e6) for stack, self_s in _stacks.items()},
+    }
+
+
+def dump_json(path: str, data: Optional[Dict[str, Any]] = None):
+    with open(path, "w") as fh:
+        json.dump(snapshot() if data is None else data, fh, indent=2)
+        fh.write("\n")
+
+
+def dump_collapsed(path: str, stacks: Optional[Dict[str, int]] = None):
+    with open(path, "w") as fh:
+        for stack, micros in sorted((snapshot()["stacks"] if stacks is None else stacks).items()):
+            fh.write(f"{stack} {micros}\n")
@@ -0,0 +1,103 @@
+"""
+Access to puzzle inputs without holding the whole text (plus a list of all its lines) in memory.
+
+The parsers accept either the input text itself or an InputFile, which memory-maps the input file. They consume their
+input through iter_lines or iter_blocks, which hand out one line (or one blank-line-separated block) at a time, so
+peak memory stays close to the size of the parsed data structures.
+"""
+import mmap
+from typing import Iterator, List, Tuple, Union
+
+
+class InputFile:
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "rb")
+        try:
+            self.buffer = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped
+            self.buffer = b""
+
+    def __enter__(self) -> "InputFile":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            try:
+                self.buffer.close()
+            except BufferError:
+                # Grids loaded from the file are views of the mapping (see grid.load_grid). In that case, the mapping
+                # is closed as soon as the last of them is garbage collected.
+                pass
+        self._fh.close()
+
+
+Source = Union[str, bytes, InputFile]
+
+
+def get_buffer(source: Source) -> Union[str, bytes, mmap.mmap]:
+    return source.buffer if isinstance(source, InputFile) else source
+
+
+def strip_bounds(data: Union[str, bytes, mmap.mmap]) -> Tuple[int, int]:
+    """
+    Start and end index of data.strip(), without copying the data.
+    """
+    whitespace = " \t\r\n" if isinstance(data, str) else b" \t\r\n"
+    start = 0
+    end = len(data)
+    while start < end and data[start] in whitespace:
+        start += 1
+    while end > start and data[end - 1] in whitespace:
+        end -= 1
+
+    return start, end
+
+
+def iter_records(source: Source, separator: str = "\n") -> Iterator[str]:
+    """
+    Lazy equivalent of source.strip().split(separator).
+    """
+    data = get_buffer(source)
+    is_text = isinstance(data, str)
+    if not is_text:
+        separator = separator.encode("ascii")
+    start, end = strip_bounds(data)
+    pos = start
+    while pos < end:
+        next_pos = data.find(separator, pos, end)
+        if next_pos == -1:
+            next_pos = end
+        record = data[pos:next_pos]
+        yield record if is_text else record.decode("ascii")
+        pos = next_pos + len(separator)
+
+
+def iter_lines(source: Source) -> Iterator[str]:
+    return iter_records(source, "\n")
+
+
+def iter_blocks(source: Source) -> Iterator[List[str]]:
+    """
+    Lines of the blank-line-separated blocks of the input, one block at a time.
+    """
+    block = []
+    for line in iter_lines(source):
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def read_text(source: Source) -> str:
+    data = get_buffer(source)
+    return data if isinstance(data, str) else data[:].decode("ascii")
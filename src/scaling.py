@@ -0,0 +1,200 @@
+"""
+Empirical complexity of the solvers.
+
+Every part is timed on generated inputs of increasing size (see generators.py), and the exponent k of the power law
+t ~ n^k is fitted to the timings on a log-log scale, with n being the input size in bytes. Comparing the exponents to a
+stored baseline catches algorithmic regressions, which a plain benchmark at a single input size may miss.
+
+Runs of a few milliseconds are dominated by fixed costs (parsing setup, NumPy calls, caches), which flatten the fitted
+exponent. So all scales are doubled until the smallest input takes at least min_seconds per run before anything is
+fitted.
+"""
+import argparse
+import math
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from baseline import check_baseline, write_report
+from benchmark import time_solver
+from days import SOLVERS, load_day
+from generators import MAX_SCALES, generate
+
+# Limit for doubling the scales in search of long enough runs, for solvers whose time hardly depends on the input size
+MAX_SCALE_FACTOR = 64
+
+
+def fit_exponent(sizes: Sequence[float], times: Sequence[float]) -> float:
+    """
+    Least-squares slope of log(times) over log(sizes).
+    """
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    denominator = sum((x - x_mean) ** 2 for x in xs)
+    if denominator == 0:
+        raise ValueError("At least two different input sizes are needed to fit an exponent.")
+
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / denominator
+
+
+def classify_exponent(exponent: float) -> str:
+    if exponent < 0.5:
+        return "sublinear"
+    if exponent < 1.3:
+        return "linear"
+    if exponent < 1.8:
+        return "superlinear"
+    if exponent < 2.3:
+        return "quadratic"
+    return "superquadratic"
+
+
+def _time_scale(module, solver, day: int, scale: float, seed: int, repeat: int) -> Tuple[int, float]:
+    text = generate(day, scale, seed)
+    run_times, _ = time_solver(module, solver, text, repeat=repeat, warmup=1)
+
+    return len(text), run_times[0]
+
+
+def measure_scaling(
+        day: int,
+        part: int,
+        scales: Sequence[float],
+        seed: int = 0,
+        repeat: int = 3,
+        max_seconds: float = 60,
+        min_seconds: float = 0.05
+) -> Dict[str, Any]:
+    module = load_day(day)
+    solver = SOLVERS[day][part - 1]
+    scales = sorted(scales)
+
+    # Doubling stops where the largest input would exceed the maximum scale of the day's generator
+    max_scale = MAX_SCALES.get(day, math.inf)
+    scale_factor = 1
+    smallest = _time_scale(module, solver, day, scales[0], seed, repeat)
+    while smallest[1] < min_seconds and scale_factor < MAX_SCALE_FACTOR and scales[-1] * scale_factor * 2 <= max_scale:
+        scale_factor *= 2
+        smallest = _time_scale(module, solver, day, scales[0] * scale_factor, seed, repeat)
+
+    sizes = [smallest[0]]
+    times = [smallest[1]]
+    for scale in scales[1:]:
+        start = time.perf_counter()
+        size, min_time = _time_scale(module, solver, day, scale * scale_factor, seed, repeat)
+        sizes.append(size)
+        times.append(min_time)
+        # Don't go on with even larger inputs if the solver already takes too long
+        if time.perf_counter() - start > max_seconds:
+            break
+
+    res = {
+        "day": day,
+        "part": part,
+        "scales": [scale * scale_factor for scale in scales[:len(sizes)]],
+        "sizes_bytes": sizes,
+        "min_ms": [t * 1000 for t in times],
+    }
+    if times[0] < min_seconds:
+        res["warning"] = (
+            f"Even with all scales multiplied by {scale_factor}, the smallest input ran for less than "
+            f"{min_seconds * 1000:g} ms."
+        )
+    if len(set(sizes)) >= 2:
+        res["exponent"] = fit_exponent(sizes, times)
+        res["growth"] = classify_exponent(res["exponent"])
+    else:
+        res["error"] = "Not enough input sizes could be measured to fit an exponent."
+
+    return res
+
+
+def get_baseline_key(res: Dict[str, Any]) -> str:
+    return f"{res['day']}.{res['part']}"
+
+
+def compare_to_baseline(
+        results: List[Dict[str, Any]], baseline: Dict[str, float], tolerance: float
+) -> List[Dict[str, Any]]:
+    regressions = []
+    for res in results:
+        key = get_baseline_key(res)
+        if "exponent" in res and key in baseline:
+            res["baseline_exponent"] = baseline[key]
+            if res["exponent"] > baseline[key] + tolerance:
+                regressions.append(res)
+
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fit empirical growth exponents of the solvers on generated inputs.")
+    parser.add_argument(
+        "-d", "--days", type=int, nargs="+", default=sorted(SOLVERS), help="Days to run (default: all)"
+    )
+    parser.add_argument(
+        "-s", "--scales", type=float, nargs="+", default=[0.25, 1, 4, 16],
+        help="Input sizes relative to the real puzzle input (doubled together until runs are long enough)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input generators")
+    parser.add_argument(
+        "-n", "--repeat", type=int, default=3, help="Timed repetitions per input size (minimum is used)"
+    )
+    parser.add_argument(
+        "--max-seconds", type=float, default=60, help="Skip larger input sizes once a single size took this long"
+    )
+    parser.add_argument(
+        "--min-seconds", type=float, default=0.05, help="Minimum time per run at the smallest input size"
+    )
+    parser.add_argument("-b", "--baseline", help="JSON file mapping '<day>.<part>' to the baseline exponent")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.3, help="Allowed increase of an exponent above its baseline"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Write the measured exponents to the baseline file"
+    )
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    unknown_days = set(args.days) - set(SOLVERS)
+    if unknown_days:
+        parser.error(f"Unknown days: {sorted(unknown_days)}")
+    if len(set(args.scales)) < 2:
+        parser.error("At least two different scales are needed.")
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline requires --baseline.")
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = []
+    for day in args.days:
+        for part in range(1, len(SOLVERS[day]) + 1):
+            try:
+                results.append(
+                    measure_scaling(day, part, args.scales, args.seed, args.repeat, args.max_seconds, args.min_seconds)
+                )
+            except Exception as e:
+                # A single broken day must not prevent the others from being measured
+                results.append({"day": day, "part": part, "error": f"{type(e).__name__}: {e}"})
+
+    regressions = check_baseline(
+        results, args.baseline, args.update_baseline, compare_to_baseline, args.tolerance, get_baseline_key, "exponent"
+    )
+    report = {
+        "tolerance": args.tolerance,
+        "results": results,
+        "regressions": [get_baseline_key(res) for res in regressions],
+    }
+    write_report(report, args.output)
+
+    # Regressions only fail the run if they are compared against an existing baseline
+    return 1 if regressions and not args.update_baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
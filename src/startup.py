@@ -0,0 +1,158 @@
+"""
+Startup cost of the day modules.
+
+Every module is imported in a fresh interpreter running with `python -X importtime`, which logs the self and cumulative
+import time of each module imported along the way. The cumulative time of the day module is its import cost, and the
+modules it imports directly show where that cost comes from. Comparing the import costs to a stored baseline catches
+heavy dependencies creeping back into module level.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from baseline import check_baseline, write_report
+from days import SOLVERS
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# e.g. "import time:       312 |      45123 |   numpy"
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( +)(\S+)")
+
+# Import times of a few milliseconds are dominated by noise, so increases below this are never reported as regressions
+MIN_REGRESSION_MS = 5
+
+
+def parse_import_times(log: str) -> List[Tuple[str, int, float, float]]:
+    """
+    Name, nesting depth, self time, and cumulative time (in ms) of every import logged by `python -X importtime`.
+    """
+    entries = []
+    for line in log.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is not None:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, (len(indent) - 1) // 2, int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    return entries
+
+
+def get_direct_dependencies(
+        entries: List[Tuple[str, int, float, float]], module_name: str
+) -> Tuple[float, Dict[str, float]]:
+    """
+    Cumulative import time of the module and of each module it imported directly. The log lists imports in the order
+    they finish, so the direct dependencies are the entries one level deeper right before the module's own entry.
+    """
+    for i in range(len(entries) - 1, -1, -1):
+        name, depth, _, cumulative_ms = entries[i]
+        if name == module_name:
+            break
+    else:
+        raise ValueError(f"Import of module {module_name} not found in the import time log.")
+
+    dependencies = {}
+    for dep_name, dep_depth, _, dep_cumulative_ms in reversed(entries[:i]):
+        if dep_depth <= depth:
+            break
+        if dep_depth == depth + 1:
+            dependencies[dep_name] = dep_cumulative_ms
+
+    return cumulative_ms, dict(sorted(dependencies.items(), key=lambda item: item[1], reverse=True))
+
+
+def measure_startup(day: int, repeat: int = 5, num_dependencies: int = 5) -> Dict[str, Any]:
+    module_name = str(day)
+    # The module names aren't valid identifiers, hence __import__ (importlib.import_module isn't logged by importtime)
+    command = [sys.executable, "-X", "importtime", "-c", f"__import__({module_name!r})"]
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(command, cwd=SRC_DIR, capture_output=True, text=True)
+        end = time.perf_counter()
+        if proc.returncode != 0:
+            return {"day": day, "error": proc.stderr.strip().splitlines()[-1]}
+        import_ms, dependencies = get_direct_dependencies(parse_import_times(proc.stderr), module_name)
+        runs.append(((end - start) * 1000, import_ms, dependencies))
+
+    # The fastest run is the one least disturbed by other processes
+    _, import_ms, dependencies = min(runs, key=lambda run: run[1])
+
+    return {
+        "day": day,
+        "repeat": repeat,
+        "process_ms": min(run[0] for run in runs),
+        "import_ms": import_ms,
+        "dependencies_ms": dict(list(dependencies.items())[:num_dependencies]),
+    }
+
+
+def get_baseline_key(res: Dict[str, Any]) -> str:
+    return str(res["day"])
+
+
+def compare_to_baseline(
+        results: List[Dict[str, Any]], baseline: Dict[str, float], tolerance: float
+) -> List[Dict[str, Any]]:
+    regressions = []
+    for res in results:
+        key = get_baseline_key(res)
+        if "import_ms" in res and key in baseline:
+            res["baseline_import_ms"] = baseline[key]
+            increase = res["import_ms"] - baseline[key]
+            if increase > baseline[key] * tolerance and increase > MIN_REGRESSION_MS:
+                regressions.append(res)
+
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure the import time of the day modules in fresh interpreters.")
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=sorted(SOLVERS), help="Days to run (default: all)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Interpreter starts per day (minimum is used)")
+    parser.add_argument("-b", "--baseline", help="JSON file mapping '<day>' to the baseline import time in ms")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.5, help="Allowed relative increase of an import time above its baseline"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Write the measured import times to the baseline file"
+    )
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    unknown_days = set(args.days) - set(SOLVERS)
+    if unknown_days:
+        parser.error(f"Unknown days: {sorted(unknown_days)}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1.")
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline requires --baseline.")
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = [measure_startup(day, args.repeat) for day in args.days]
+
+    regressions = check_baseline(
+        results, args.baseline, args.update_baseline, compare_to_baseline, args.tolerance, get_baseline_key, "import_ms"
+    )
+
+    report = {
+        "python": sys.version.split()[0],
+        "tolerance": args.tolerance,
+        "results": results,
+        "regressions": [res["day"] for res in regressions],
+    }
+    write_report(report, args.output)
+
+    # Regressions only fail the run if they are compared against an existing baseline
+    return 1 if regressions and not args.update_baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())